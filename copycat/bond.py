@@ -1,7 +1,9 @@
-from .workspace_structure import WorkspaceStructure
+from .workspace_structure import KIND_BOND, WorkspaceStructure
 
 
 class Bond(WorkspaceStructure):
+    _kind = KIND_BOND
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -56,7 +58,7 @@ class Bond(WorkspaceStructure):
 
     def buildBond(self):
         workspace = self.ctx.workspace
-        workspace.structures += [self]
+        workspace.add_structure(self)
         self.string.bonds += [self]
         self.category.buffer = 100.0
         if self.directionCategory:
@@ -71,8 +73,7 @@ class Bond(WorkspaceStructure):
 
     def breakBond(self):
         workspace = self.ctx.workspace
-        if self in workspace.structures:
-            workspace.structures.remove(self)
+        workspace.remove_structure(self)
         if self in self.string.bonds:
             self.string.bonds.remove(self)
         self.leftObject.rightBond = None
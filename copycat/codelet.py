@@ -22,6 +22,8 @@ class Codelet(object):
         birthdate (int): The birthdate of the codelet, representing the time it was created.
     """
 
+    __slots__ = ("name", "urgency", "arguments", "birthdate")
+
     name: str
     urgency: float
     arguments: List
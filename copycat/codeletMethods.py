@@ -1140,11 +1140,13 @@ def correspondence_builder(ctx, codelet):
         # if the correspondence exists, activate concept mappings
         # and add new ones to the existing corr.
         existing = correspondence.objectFromInitial.correspondence
+        kindKeys = {m.kindKey for m in existing.conceptMappings}
         for mapping in correspondence.conceptMappings:
             if mapping.label:
                 mapping.label.buffer = 100.0
-            if not mapping.isContainedBy(existing.conceptMappings):
+            if not mapping.isContainedBy(existing.conceptMappings, kindKeys):
                 existing.conceptMappings += [mapping]
+                kindKeys.add(mapping.kindKey)
         return
     incompatibles = correspondence.getIncompatibleCorrespondences()
     # fight against all correspondences
@@ -1,4 +1,11 @@
 class ConceptMapping(object):
+    __slots__ = (
+        'slipnet', 'initialDescriptionType', 'targetDescriptionType',
+        'initialDescriptor', 'targetDescriptor',
+        'initialObject', 'targetObject', 'label',
+        '_assocLink', '_depth', 'nearKey', 'kindKey',
+    )
+
     def __init__(self, initialDescriptionType, targetDescriptionType,
                  initialDescriptor, targetDescriptor,
                  initialObject, targetObject):
@@ -10,6 +17,18 @@ class ConceptMapping(object):
         self.initialObject = initialObject
         self.targetObject = targetObject
         self.label = initialDescriptor.get_bond_category(targetDescriptor)
+        # The slipnet graph is fixed, so the link joining the two descriptors
+        # (and their combined depth) can be found once; only the link's
+        # degree of association varies with activation.
+        self._assocLink = None
+        if initialDescriptor is not targetDescriptor:
+            self._assocLink = initialDescriptor.slip_links.get(targetDescriptor)
+        self._depth = (initialDescriptor.conceptual_depth +
+                       targetDescriptor.conceptual_depth) / 200.0
+        # hashable signatures matching sameKind() and nearlySameKind()
+        self.nearKey = (initialDescriptionType, targetDescriptionType,
+                        initialDescriptor)
+        self.kindKey = self.nearKey + (targetDescriptor,)
 
     def __repr__(self):
         return '<ConceptMapping: %s from %s to %s>' % (
@@ -22,33 +41,28 @@ class ConceptMapping(object):
         association = self.__degreeOfAssociation()
         if association == 100.0:
             return 100.0
-        depth = self.__conceptualDepth() / 100.0
+        depth = self._depth
         return association * (1 - depth * depth)
 
     def __degreeOfAssociation(self):
         # Assumes the 2 descriptors are connected in the slipnet by <= 1 link
-        if self.initialDescriptor == self.targetDescriptor:
+        if self._assocLink is not None:
+            return self._assocLink.degree_of_association()
+        if self.initialDescriptor is self.targetDescriptor:
             return 100.0
-        for link in self.initialDescriptor.lateral_slip_links:
-            if link.destination == self.targetDescriptor:
-                return link.degree_of_association()
         return 0.0
 
     def strength(self):
         association = self.__degreeOfAssociation()
         if association == 100.0:
             return 100.0
-        depth = self.__conceptualDepth() / 100.0
+        depth = self._depth
         return association * (1 + depth * depth)
 
-    def __conceptualDepth(self):
-        return (self.initialDescriptor.conceptual_depth +
-                self.targetDescriptor.conceptual_depth) / 2.0
-
     def distinguishing(self):
         slipnet = self.slipnet
-        if self.initialDescriptor == slipnet.whole:
-            if self.targetDescriptor == slipnet.whole:
+        if self.initialDescriptor is slipnet.whole:
+            if self.targetDescriptor is slipnet.whole:
                 return False
         if not self.initialObject.distinguishingDescriptor(
                 self.initialDescriptor):
@@ -57,19 +71,19 @@ class ConceptMapping(object):
             self.targetDescriptor)
 
     def sameInitialType(self, other):
-        return self.initialDescriptionType == other.initialDescriptionType
+        return self.initialDescriptionType is other.initialDescriptionType
 
     def sameTargetType(self, other):
-        return self.targetDescriptionType == other.targetDescriptionType
+        return self.targetDescriptionType is other.targetDescriptionType
 
     def sameTypes(self, other):
         return self.sameInitialType(other) and self.sameTargetType(other)
 
     def sameInitialDescriptor(self, other):
-        return self.initialDescriptor == other.initialDescriptor
+        return self.initialDescriptor is other.initialDescriptor
 
     def sameTargetDescriptor(self, other):
-        return self.targetDescriptor == other.targetDescriptor
+        return self.targetDescriptor is other.targetDescriptor
 
     def sameDescriptors(self, other):
         if self.sameInitialDescriptor(other):
@@ -82,16 +96,25 @@ class ConceptMapping(object):
     def nearlySameKind(self, other):
         return self.sameTypes(other) and self.sameInitialDescriptor(other)
 
-    def isContainedBy(self, mappings):
+    def isContainedBy(self, mappings, kindKeys=None):
+        # Callers that keep a set of the mappings' kindKeys can pass it
+        # to avoid scanning the list.
+        if kindKeys is not None:
+            return self.kindKey in kindKeys
         return any(self.sameKind(mapping) for mapping in mappings)
 
-    def isNearlyContainedBy(self, mappings):
+    def isNearlyContainedBy(self, mappings, nearKeys=None):
+        if nearKeys is not None:
+            return self.nearKey in nearKeys
         return any(self.nearlySameKind(mapping) for mapping in mappings)
 
     def related(self, other):
-        if self.initialDescriptor.related(other.initialDescriptor):
+        # identical descriptors are trivially related; skip the slipnet call
+        initial, otherInitial = self.initialDescriptor, other.initialDescriptor
+        if initial is otherInitial or initial.related(otherInitial):
             return True
-        return self.targetDescriptor.related(other.targetDescriptor)
+        target, otherTarget = self.targetDescriptor, other.targetDescriptor
+        return target is otherTarget or target.related(otherTarget)
 
     def incompatible(self, other):
         # Concept-mappings (a -> b) and (c -> d) are incompatible if a is
@@ -101,11 +124,12 @@ class ConceptMapping(object):
         # to right, but the relationships (opposite and identity) are different
         # Notice that slipnet distances are not looked at, only slipnet links.
         # This should be changed eventually.
-        if not self.related(other):
-            return False
+        # The label tests are cheap, so do them before walking the slipnet.
         if not self.label or not other.label:
             return False
-        return self.label != other.label
+        if self.label is other.label:
+            return False
+        return self.related(other)
 
     def supports(self, other):
         # Concept-mappings (a -> b) and (c -> d) support each other if a is
@@ -121,12 +145,12 @@ class ConceptMapping(object):
 
         if self.sameDescriptors(other):
             return True
-        # if the descriptors are not related return false
-        if not self.related(other):
-            return False
         if not self.label or not other.label:
             return False
-        return self.label == other.label
+        if self.label is not other.label:
+            return False
+        # if the descriptors are not related return false
+        return self.related(other)
 
     def relevant(self):
         if self.initialDescriptionType.fully_active():
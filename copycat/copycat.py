@@ -38,6 +38,13 @@ class Copycat(object):
             self.gui = GUI('Copycat')
         self.lastUpdate = float('-inf')
 
+    def reset(self):
+        """Forget everything from previous runs, keeping the built slipnet."""
+        self.coderack.reset()
+        self.slipnet.reset()
+        self.temperature.reset()
+        self.lastUpdate = float('-inf')
+
     def step(self):
         self.coderack.chooseAndRunCodelet()
         self.reporter.report_coderack(self.coderack)
@@ -74,7 +81,7 @@ class Copycat(object):
         """Run a trial of the copycat algorithm"""
         self.coderack.reset()
         self.slipnet.reset()
-        self.temperature.reset() # TODO: use entropy
+        self.temperature.reset(new_run=False) # TODO: use entropy
         self.workspace.reset()
         while self.workspace.final_answer is None:
             self.mainLoop()
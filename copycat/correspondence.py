@@ -1,11 +1,13 @@
 from .conceptMapping import ConceptMapping
 from .group import Group
 from .letter import Letter
-from .workspace_structure import WorkspaceStructure
+from .workspace_structure import KIND_CORRESPONDENCE, WorkspaceStructure
 from . import formulas
 
 
 class Correspondence(WorkspaceStructure):
+    _kind = KIND_CORRESPONDENCE
+
     def __init__(self, ctx, objectFromInitial, objectFromTarget,
                  conceptMappings, flipTargetObject):
         WorkspaceStructure.__init__(self, ctx)
@@ -165,7 +167,7 @@ class Correspondence(WorkspaceStructure):
 
     def buildCorrespondence(self):
         workspace = self.ctx.workspace
-        workspace.structures += [self]
+        workspace.add_structure(self)
         if self.objectFromInitial.correspondence:
             self.objectFromInitial.correspondence.breakCorrespondence()
         if self.objectFromTarget.correspondence:
@@ -199,6 +201,6 @@ class Correspondence(WorkspaceStructure):
 
     def breakCorrespondence(self):
         workspace = self.ctx.workspace
-        workspace.structures.remove(self)
+        workspace.remove_structure(self)
         self.objectFromInitial.correspondence = None
         self.objectFromTarget.correspondence = None
@@ -1,7 +1,9 @@
-from .workspace_structure import WorkspaceStructure
+from .workspace_structure import KIND_DESCRIPTION, WorkspaceStructure
 
 
 class Description(WorkspaceStructure):
+    _kind = KIND_DESCRIPTION
+
     def __init__(self, workspaceObject, descriptionType, descriptor):
         WorkspaceStructure.__init__(self, workspaceObject.ctx)
         self.object = workspaceObject
@@ -48,10 +50,14 @@ class Description(WorkspaceStructure):
         self.descriptionType.buffer = 100.0
         self.descriptor.buffer = 100.0
         if not self.object.described(self.descriptor):
-            self.object.descriptions += [self]
+            self.object.attachDescription(self)
 
     def breakDescription(self):
+        self._detach()
+        self.object.detachDescription(self)
+
+    def _detach(self):
+        # Everything breakDescription does except removing ourselves from
+        # the object, for callers that drop all its descriptions at once.
         workspace = self.ctx.workspace
-        if self in workspace.structures:
-            workspace.structures.remove(self)
-        self.object.descriptions.remove(self)
+        workspace.remove_structure(self)
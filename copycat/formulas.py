@@ -1,4 +1,4 @@
-from typing import Callable, List, Tuple, Iterable
+from typing import Callable, Dict, List, Tuple, Iterable
 from .conceptMapping import ConceptMapping
 
 
@@ -69,7 +69,7 @@ def local_bond_category_relevance(
     """
 
     def is_relevant(o: "WorkspaceObject") -> bool:  # type: ignore  # noqa: F821
-        return o.rightBond and o.rightBond.category == category
+        return o.rightBond and o.rightBond.category is category
 
     if len(string.objects) == 1:
         return 0.0
@@ -92,7 +92,7 @@ def local_direction_category_relevance(
     """
 
     def is_relevant(o):
-        return o.rightBond and o.rightBond.directionCategory == direction
+        return o.rightBond and o.rightBond.directionCategory is direction
 
     return __local_relevance(string, is_relevant)
 
@@ -118,21 +118,30 @@ def get_mappings(
         the initial and target descriptions.
     """
 
+    # Bucket the targets by description type so each initial description
+    # only looks at the targets it can actually map onto.
+    targets_by_type: Dict[object, List] = {}
+    for target in target_descriptions:
+        targets_by_type.setdefault(target.descriptionType, []).append(target)
+
     mappings: List[ConceptMapping] = []
     for initial in initial_descriptions:
-        for target in target_descriptions:
-            if initial.descriptionType == target.descriptionType:
-                if (
-                    initial.descriptor == target.descriptor
-                    or initial.descriptor.slip_linked(target.descriptor)
-                ):
-                    mapping = ConceptMapping(
-                        initial.descriptionType,
-                        target.descriptionType,
-                        initial.descriptor,
-                        target.descriptor,
-                        object_from_initial,
-                        object_from_target,
-                    )
-                    mappings += [mapping]
+        targets = targets_by_type.get(initial.descriptionType)
+        if not targets:
+            continue
+        initial_descriptor = initial.descriptor
+        slip_linked = initial_descriptor.slip_linked
+        for target in targets:
+            if initial_descriptor == target.descriptor or slip_linked(
+                target.descriptor
+            ):
+                mapping = ConceptMapping(
+                    initial.descriptionType,
+                    target.descriptionType,
+                    initial_descriptor,
+                    target.descriptor,
+                    object_from_initial,
+                    object_from_target,
+                )
+                mappings.append(mapping)
     return mappings
@@ -1,15 +1,33 @@
 from .description import Description
 from .workspace_object import WorkspaceObject
+from .workspace_structure import KIND_GROUP
 from . import formulas
 
+# internal-strength length factor, indexed by the number of grouped objects
+_LENGTH_FACTORS = (0.0, 5.0, 20.0, 60.0)
+# single-letter-group exponent, indexed by the number of supporting groups
+_SINGLE_LETTER_EXPONENTS = (0.0, 4.0, 2.0)
+
 
 class Group(WorkspaceObject):
+    _kind = KIND_GROUP
+
     # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        '_slipnet', '_random', '_temperature', '_workspace',
+        'groupCategory', 'directionCategory', 'facet', 'objectList',
+        'bondList', 'bondCategory', 'groupKey', 'bondDescriptions',
+    )
+
     def __init__(self, string, groupCategory, directionCategory, facet,
                  objectList, bondList):
         # pylint: disable=too-many-arguments
         WorkspaceObject.__init__(self, string)
-        slipnet = self.ctx.slipnet
+        # ctx never swaps these out, so bind them once for the hot methods
+        self._slipnet = slipnet = self.ctx.slipnet
+        self._random = self.ctx.random
+        self._temperature = self.ctx.temperature
+        self._workspace = self.ctx.workspace
         self.groupCategory = groupCategory
         self.directionCategory = directionCategory
         self.facet = facet
@@ -18,14 +36,12 @@ class Group(WorkspaceObject):
         self.bondCategory = self.groupCategory.get_related_node(
             slipnet.bond_category)
 
-        leftObject = objectList[0]
-        rightObject = objectList[-1]
-        self.leftIndex = leftObject.leftIndex
-        self.leftmost = self.leftIndex == 1
-        self.rightIndex = rightObject.rightIndex
-        self.rightmost = self.rightIndex == len(self.string)
+        self._setExtent(objectList[0].leftIndex, objectList[-1].rightIndex,
+                        self.string.length)
+        # everything sameGroup() compares, for WorkspaceString's group index
+        self.groupKey = (self.leftIndex, self.rightIndex, groupCategory,
+                         directionCategory, facet)
 
-        self.descriptions = []
         self.bondDescriptions = []
         self.name = ''
 
@@ -44,7 +60,7 @@ class Group(WorkspaceObject):
             self.addDescription(self.facet, letter)
         if self.directionCategory:
             self.addDescription(slipnet.direction_category, self.directionCategory)
-        if self.spansString():
+        if self._spans:
             self.addDescription(slipnet.string_position_category, slipnet.whole)
         elif self.leftmost:
             self.addDescription(slipnet.string_position_category, slipnet.leftmost)
@@ -56,8 +72,8 @@ class Group(WorkspaceObject):
 
     def add_length_description_category(self):
         # check whether or not to add length description category
-        random = self.ctx.random
-        slipnet = self.ctx.slipnet
+        random = self._random
+        slipnet = self._slipnet
         probability = self.lengthDescriptionProbability()
         if random.coin_flip(probability):
             length = len(self.objectList)
@@ -71,36 +87,40 @@ class Group(WorkspaceObject):
         return 'group[%d:%d] == %s' % (l, r - 1, s[l:r])
 
     def getIncompatibleGroups(self):
+        # Every group above any of our objects, each reported once.  Objects
+        # usually share their enclosing groups, so stop climbing as soon as we
+        # reach a group whose ancestors have already been collected.
         result = []
+        seen = set()
         for objekt in self.objectList:
-            while objekt.group:
-                result += [objekt.group]
-                objekt = objekt.group
+            group = objekt.group
+            while group and group not in seen:
+                seen.add(group)
+                result.append(group)
+                group = group.group
         return result
 
     def addBondDescription(self, description):
         self.bondDescriptions += [description]
 
     def singleLetterGroupProbability(self):
-        slipnet = self.ctx.slipnet
-        temperature = self.ctx.temperature
+        slipnet = self._slipnet
+        temperature = self._temperature
         numberOfSupporters = self.numberOfLocalSupportingGroups()
         if not numberOfSupporters:
             return 0.0
-        if numberOfSupporters == 1:
-            exp = 4.0
-        elif numberOfSupporters == 2:
-            exp = 2.0
+        if numberOfSupporters < 3:
+            exp = _SINGLE_LETTER_EXPONENTS[numberOfSupporters]
         else:
             exp = 1.0
-        support = self.localSupport() / 100.0
+        support = self.localSupport(numberOfSupporters) / 100.0
         activation = slipnet.length.activation / 100.0
         supportedActivation = (support * activation) ** exp
         #TODO: use entropy
         return temperature.getAdjustedProbability(supportedActivation)
 
     def flippedVersion(self):
-        slipnet = self.ctx.slipnet
+        slipnet = self._slipnet
         flippedBonds = [b.flippedversion() for b in self.bondList]
         flippedGroup = self.groupCategory.getRelatedNode(slipnet.flipped)
         flippedDirection = self.directionCategory.getRelatedNode(
@@ -109,10 +129,10 @@ class Group(WorkspaceObject):
                      self.facet, self.objectList, flippedBonds)
 
     def buildGroup(self):
-        workspace = self.ctx.workspace
-        workspace.objects += [self]
-        workspace.structures += [self]
-        self.string.objects += [self]
+        workspace = self._workspace
+        workspace.add_object(self)
+        workspace.add_structure(self)
+        self.string.add_group(self)
         for objekt in self.objectList:
             objekt.group = self
         workspace.build_descriptions(self)
@@ -123,8 +143,8 @@ class Group(WorkspaceObject):
             description.descriptor.buffer = 100.0
 
     def lengthDescriptionProbability(self):
-        slipnet = self.ctx.slipnet
-        temperature = self.ctx.temperature
+        slipnet = self._slipnet
+        temperature = self._temperature
         length = len(self.objectList)
         if length > 5:
             return 0.0
@@ -141,7 +161,7 @@ class Group(WorkspaceObject):
         self.breakGroup()
 
     def breakGroup(self):
-        workspace = self.ctx.workspace
+        workspace = self._workspace
         if self.correspondence:
             self.correspondence.breakCorrespondence()
         if self.group:
@@ -151,30 +171,23 @@ class Group(WorkspaceObject):
         if self.rightBond:
             self.rightBond.breakBond()
 
-        while len(self.descriptions):
-            description = self.descriptions[-1]
-            description.breakDescription()
+        descriptions = self.clearDescriptions()
+        for description in reversed(descriptions):
+            description._detach()
         for o in self.objectList:
             o.group = None
-        if self in workspace.structures:
-            workspace.structures.remove(self)
-        if self in workspace.objects:
-            workspace.objects.remove(self)
-        if self in self.string.objects:
-            self.string.objects.remove(self)
+        workspace.remove_structure(self)
+        workspace.remove_object(self)
+        self.string.remove_group(self)
 
     def update_internal_strength(self):
-        slipnet = self.ctx.slipnet
+        slipnet = self._slipnet
         relatedBondAssociation = self.groupCategory.get_related_node(
             slipnet.bond_category).degree_of_association()
         bondWeight = relatedBondAssociation ** 0.98
         length = len(self.objectList)
-        if length == 1:
-            lengthFactor = 5.0
-        elif length == 2:
-            lengthFactor = 20.0
-        elif length == 3:
-            lengthFactor = 60.0
+        if length < 4:
+            lengthFactor = _LENGTH_FACTORS[length]
         else:
             lengthFactor = 90.0
         lengthWeight = 100.0 - bondWeight
@@ -188,26 +201,30 @@ class Group(WorkspaceObject):
         else:
             self.external_strength = self.localSupport()
 
-    def localSupport(self):
-        numberOfSupporters = self.numberOfLocalSupportingGroups()
+    def localSupport(self, numberOfSupporters=None):
+        if numberOfSupporters is None:
+            numberOfSupporters = self.numberOfLocalSupportingGroups()
         if numberOfSupporters == 0:
             return 0.0
         supportFactor = min(1.0, 0.6 ** (1 / (numberOfSupporters ** 3)))
-        densityFactor = 100.0 * ((self.localDensity() / 100.0) ** 0.5)
+        density = self.localDensity(numberOfSupporters)
+        densityFactor = 100.0 * ((density / 100.0) ** 0.5)
         return densityFactor * supportFactor
 
     def numberOfLocalSupportingGroups(self):
-        count = 0
-        for objekt in self.string.objects:
-            if isinstance(objekt, Group) and self.isOutsideOf(objekt):
-                if (objekt.groupCategory == self.groupCategory and
-                        objekt.directionCategory == self.directionCategory):
-                    count += 1
-        return count
-
-    def localDensity(self):
-        numberOfSupporters = self.numberOfLocalSupportingGroups()
-        halfLength = len(self.string) / 2.0
+        groupCategory = self.groupCategory
+        directionCategory = self.directionCategory
+        isOutsideOf = self.isOutsideOf
+        return sum(1 for objekt in self.string.objects
+                   if isinstance(objekt, Group) and isOutsideOf(objekt) and
+                   objekt.groupCategory is groupCategory and
+                   objekt.directionCategory is directionCategory)
+
+    def localDensity(self, numberOfSupporters=None):
+        if numberOfSupporters is None:
+            numberOfSupporters = self.numberOfLocalSupportingGroups()
+        # WorkspaceString.length is fixed, and cheaper than len(self.string)
+        halfLength = self.string.length / 2.0
         return 100.0 * numberOfSupporters / halfLength
 
     def sameGroup(self, other):
@@ -215,11 +232,11 @@ class Group(WorkspaceObject):
             return False
         if self.rightIndex != other.rightIndex:
             return False
-        if self.groupCategory != other.groupCategory:
+        if self.groupCategory is not other.groupCategory:
             return False
-        if self.directionCategory != other.directionCategory:
+        if self.directionCategory is not other.directionCategory:
             return False
-        if self.facet != other.facet:
+        if self.facet is not other.facet:
             return False
         return True
 
@@ -229,9 +246,9 @@ class Group(WorkspaceObject):
             return False
         for objekt in self.string.objects:
             # check to see if they are of the same type
-            if isinstance(objekt, Group) and objekt != self:
+            if isinstance(objekt, Group) and objekt is not self:
                 # check all descriptions for the descriptor
                 for description in objekt.descriptions:
-                    if description.descriptor == descriptor:
+                    if description.descriptor is descriptor:
                         return False
         return True
@@ -1,16 +1,17 @@
 from .workspace_object import WorkspaceObject
+from .workspace_structure import KIND_LETTER
 
 
 class Letter(WorkspaceObject):
+    _kind = KIND_LETTER
+    __slots__ = ()
+
     def __init__(self, string, position, length):
         WorkspaceObject.__init__(self, string)
         workspace = self.ctx.workspace
-        workspace.objects += [self]
-        string.objects += [self]
-        self.leftIndex = position
-        self.leftmost = self.leftIndex == 1
-        self.rightIndex = position
-        self.rightmost = self.rightIndex == length
+        workspace.add_object(self)
+        string.objects.append(self)
+        self._setExtent(position, position, length)
 
     def describe(self, position, length):
         slipnet = self.ctx.slipnet
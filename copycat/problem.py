@@ -3,13 +3,25 @@ from .copycat import Copycat
 from pprint import pprint
 
 class Problem:
+    # One engine shared by every Problem: building a Copycat (and its slipnet)
+    # is costly, and Copycat.reset() clears everything a run depends on.
+    # Kept on the class so it is never pickled along with the distributions.
+    _engine = None
+
+    @classmethod
+    def _get_engine(cls):
+        if cls._engine is None:
+            cls._engine = Copycat()
+        return cls._engine
+
     def __init__(self, initial, modified, target, iterations, distributions=None, formulas=None):
         self.formulas = formulas
+        copycat = self._get_engine()
         if formulas is not None:
-            assert hasattr(Copycat(), 'temperature')
+            assert hasattr(copycat, 'temperature')
         else:
-            if hasattr(Copycat(), 'temperature'):
-                self.formulas = set(Copycat().temperature.adj_formulas())
+            if hasattr(copycat, 'temperature'):
+                self.formulas = set(copycat.temperature.adj_formulas())
         print(self.formulas)
         self.initial  = initial
         self.modified = modified
@@ -43,9 +55,10 @@ class Problem:
         print('Testing copycat problem: {} : {} :: {} : _'.format(self.initial,
                                                                   self.modified,
                                                                   self.target))
-        copycat = Copycat()
+        copycat = self._get_engine()
         answers  = dict()
         if self.formulas == None:
+            copycat.reset()
             if hasattr(copycat, 'temperature'):
                 formula = copycat.temperature.getAdj()
             else:
@@ -57,6 +70,7 @@ class Problem:
         else:
             print(self.formulas)
             for formula in self.formulas:
+                copycat.reset()
                 copycat.temperature.useAdj(formula)
                 answers[formula] = copycat.run(self.initial,
                                         self.modified,
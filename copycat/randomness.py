@@ -1,9 +1,5 @@
 """
-This module provides utility functions and classes for randomness operations.
-
-Functions:
-    accumulate(iterable: Iterable) -> Iterator[int]:
-        Generates a running total of values from the given iterable.
+This module provides utility classes for randomness operations.
 
 Classes:
     Randomness:
@@ -11,30 +7,15 @@ Classes:
 """
 
 import bisect
-import math
 import random
 
-from typing import Iterable, Iterator, Optional, Sequence, Union, TypeVar
+from itertools import accumulate
+from math import sqrt
+from typing import Iterable, Optional, Sequence, Union, TypeVar
 
 T = TypeVar("T")  # 'T' is a generic type
 
 
-def accumulate(iterable: Iterable) -> Iterator[int]:
-    """
-    Generates a running total of values from the given iterable.
-
-    Args:
-        iterable (Iterable): An iterable of numeric values.
-
-    Yields:
-        int: The running total of the values.
-    """
-    total = 0
-    for v in iterable:
-        total += v
-        yield total
-
-
 class Randomness(object):
     """
     A class that encapsulates random operations with an optional seed.
@@ -47,6 +28,8 @@ class Randomness(object):
             Returns a random element from the non-empty sequence seq.
     """
 
+    __slots__ = ("rng",)
+
     def __init__(self, seed: Optional[Union[int, float, str, bytes, bytearray]] = None):
         """
         Initializes the Randomness instance with an optional seed.
@@ -131,7 +114,8 @@ class Randomness(object):
 
     def sqrt_blur(self, value: float):
         """This is exceedingly dumb, but it matches the Java code."""
-        root = math.sqrt(value)
-        if self.coin_flip():
+        root = sqrt(value)
+        # same draw as coin_flip(), without the extra method call
+        if self.rng.random() < 0.5:
             return value + root
         return value - root
@@ -1,7 +1,9 @@
-from .workspace_structure import WorkspaceStructure
+from .workspace_structure import KIND_REPLACEMENT, WorkspaceStructure
 
 
 class Replacement(WorkspaceStructure):
+    _kind = KIND_REPLACEMENT
+
     def __init__(self, ctx, objectFromInitial, objectFromModified, relation):
         WorkspaceStructure.__init__(self, ctx)
         self.objectFromInitial = objectFromInitial
@@ -1,11 +1,13 @@
 import logging
 
 
-from .workspace_structure import WorkspaceStructure
+from .workspace_structure import KIND_RULE, WorkspaceStructure
 from . import formulas
 
 
 class Rule(WorkspaceStructure):
+    _kind = KIND_RULE
+
     def __init__(self, ctx, facet, descriptor, category, relation):
         WorkspaceStructure.__init__(self, ctx)
         self.facet = facet
@@ -1,11 +1,11 @@
 """
 This module defines the Sliplink class, which represents a link between two nodes
 with an optional label and fixed length. The class provides methods to calculate
-the degree of association and spread activation between nodes.
+the degree of association between nodes.
 """
 
 from typing import Optional
-from .slipnode import Slipnode
+from .slipnode import FULL_ACTIVATION, Slipnode
 
 
 class Sliplink:
@@ -13,10 +13,21 @@ class Sliplink:
     Represents a link between two nodes with an optional label and fixed length.
     """
 
+    __slots__ = (
+        "source",
+        "destination",
+        "label",
+        "fixed_length",
+        "_intrinsic_degree_of_association",
+        "_association_node",
+    )
+
     source: Slipnode
     destination: Slipnode
     label: Optional[Slipnode]
     fixed_length: float
+    _intrinsic_degree_of_association: float
+    _association_node: Optional[Slipnode]
 
     def __init__(
         self,
@@ -38,8 +49,16 @@ class Sliplink:
         self.destination = destination
         self.label = label
         self.fixed_length = length
-        source.outgoing_links += [self]
-        destination.incoming_links += [self]
+        # both lengths are fixed at construction, so this never changes
+        if length > 1:
+            self._intrinsic_degree_of_association = 100.0 - length
+        elif label:
+            self._intrinsic_degree_of_association = 100.0 - label.intrinsic_link_length
+        else:
+            self._intrinsic_degree_of_association = 0.0
+        # the label's activation decides the association of unfixed labelled links
+        self._association_node = label if length <= 0 and label else None
+        source.outgoing_links.append(self)
 
     def degree_of_association(self) -> float:
         """
@@ -48,9 +67,13 @@ class Sliplink:
         Returns:
             float: The degree of association.
         """
-        if self.fixed_length > 0 or not self.label:
+        node = self._association_node
+        if node is None:
             return 100.0 - self.fixed_length
-        return self.label.degree_of_association()
+        # inlines node.degree_of_association(), which can't recurse any further
+        if node.activation > FULL_ACTIVATION:
+            return 100.0 - node.shrunk_link_length
+        return 100.0 - node.intrinsic_link_length
 
     def intrinsic_degree_of_association(self) -> float:
         """
@@ -59,17 +82,7 @@ class Sliplink:
         Returns:
             float: The intrinsic degree of association.
         """
-        if self.fixed_length > 1:
-            return 100.0 - self.fixed_length
-        if self.label:
-            return 100.0 - self.label.intrinsic_link_length
-        return 0.0
-
-    def spread_activation(self) -> None:
-        """
-        Spreads activation to the destination node based on the intrinsic degree of association.
-        """
-        self.destination.buffer += self.intrinsic_degree_of_association()
+        return self._intrinsic_degree_of_association
 
     def points_at(self, other: Slipnode) -> bool:
         """
@@ -81,4 +94,4 @@ class Sliplink:
         Returns:
             bool: True if the link points at the given node, False otherwise.
         """
-        return self.destination == other
+        return self.destination is other
@@ -8,21 +8,60 @@ Classes:
         for managing the network's state and behavior.
 """
 
-from typing import List, Optional
+from typing import Dict, FrozenSet, Optional, Sequence, Tuple
+
+import numpy as np
 
 from .randomness import Randomness
-from .slipnode import Slipnode
+from .slipnode import FULL_ACTIVATION, JUMP_THRESHOLD, Slipnode
 from .sliplink import Sliplink
 
+# the per-node link lists that Slipnet.__add_link files a new link under
+_SLIP_LINK = 1
+_NON_SLIP_LINK = 2
+_CATEGORY_LINK = 4
+_INSTANCE_LINK = 8
+_PROPERTY_LINK = 16
+
+def _step_activations(
+    activation: np.ndarray,
+    buffer: np.ndarray,
+    clamped: np.ndarray,
+    retention: np.ndarray,
+    sources: np.ndarray,
+    destinations: np.ndarray,
+    weights: np.ndarray,
+) -> np.ndarray:
+    """
+    Computes one tick of decay, spreading and buffering, before any jumps.
+
+    Args:
+        activation (np.ndarray): Activation of each node at the start of the tick.
+        buffer (np.ndarray): Buffered input of each node; updated in place.
+        clamped (np.ndarray): Whether each node's activation is clamped.
+        retention (np.ndarray): 100 minus each node's conceptual depth.
+        sources, destinations (np.ndarray): Node indices of each link's ends.
+        weights (np.ndarray): Intrinsic degree of association of each link.
+
+    Returns:
+        np.ndarray: The new activations, clipped to 0..100.
+    """
+    buffer -= activation * retention / 100.0
+    # one mask per tick stands in for every node's fully_active()
+    spreading = (activation > FULL_ACTIVATION)[sources]
+    np.add.at(buffer, destinations[spreading], weights[spreading])
+    activation = np.where(clamped, activation, activation + buffer)
+    return np.clip(activation, 0.0, 100.0, out=activation)
+
 
 class Slipnet(object):
     """
     Slipnet class represents a network of slipnodes that facilitates the activation and interaction of various elements such as letters, numbers, and their relationships.
     Attributes:
         number_of_updates (int): The count of updates performed on the Slipnet.
-        slipnodes (List[Slipnode]): A list of all slipnodes in the Slipnet.
-        letters (List[Slipnode]): A list of slipnodes representing letters.
-        numbers (List[Slipnode]): A list of slipnodes representing numbers.
+        slipnodes (Sequence[Slipnode]): A tuple of all slipnodes in the Slipnet.
+        letters (Sequence[Slipnode]): A tuple of slipnodes representing letters.
+        numbers (Sequence[Slipnode]): A tuple of slipnodes representing numbers.
         leftmost, rightmost, middle, single, whole (Slipnode): Slipnodes representing string positions.
         first, last (Slipnode): Slipnodes representing alphabetic positions.
         left, right (Slipnode): Slipnodes representing directions.
@@ -31,25 +70,28 @@ class Slipnet(object):
         identity, opposite (Slipnode): Slipnodes representing other relations.
         letter, group (Slipnode): Slipnodes representing objects.
         letter_category, string_position_category, alphabetic_position_category, direction_category, bond_category, group_category, length, object_category, bond_facet (Slipnode): Slipnodes representing various categories.
-        initially_clamped_slipnodes (List[Slipnode]): A list of slipnodes that are initially clamped.
+        initially_clamped_slipnodes (Sequence[Slipnode]): A tuple of slipnodes that are initially clamped.
+        buffers (np.ndarray): The buffered activation of each slipnode, indexed by Slipnode.index.
+        clamped (np.ndarray): Whether each slipnode is clamped, indexed by Slipnode.index.
     Methods:
         __init__: Initializes the Slipnet instance and sets up the initial nodes and links.
         reset: Resets the Slipnet by resetting all nodes and clamping the initially clamped nodes.
+        __getstate__, __setstate__: Pickle a built Slipnet, e.g. to restore it without rebuilding.
         update: Updates the Slipnet by spreading activation and updating the state of each node.
+        __update_until_unclamped: Stands in for update until the initially clamped nodes are released.
         is_distinguishing_descriptor: Determines if a given descriptor is unique among its type.
         __add_initial_nodes: Initializes the slipnet with a set of predefined nodes.
         __add_initial_links: Establishes connections between various elements in the slipnet.
-        __add_link: Adds a link between two Slipnodes.
-        __add_slip_link: Adds a lateral slip link between two Slipnodes.
-        __add_non_slip_link: Adds a non-slip link between two Slipnodes.
+        __build_topology: Builds the shared decay and link arrays that update reads.
+        __add_link: Adds a link between two Slipnodes to the given kinds of link lists.
         __add_bidirectional_link: Adds a bidirectional link between two Slipnodes.
     """
 
     number_of_updates: int
-    slipnodes: List[Slipnode]
+    slipnodes: Sequence[Slipnode]
 
-    letters: List[Slipnode]
-    numbers: List[Slipnode]
+    letters: Sequence[Slipnode]
+    numbers: Sequence[Slipnode]
 
     # string positions
     leftmost: Slipnode
@@ -95,13 +137,51 @@ class Slipnet(object):
     object_category: Slipnode
     bond_facet: Slipnode
 
-    initially_clamped_slipnodes: List[Slipnode]
+    initially_clamped_slipnodes: Sequence[Slipnode]
+
+    # descriptors shared by every object of a type
+    _non_distinguishing: FrozenSet[Slipnode]
+
+    # the count each number node names, "1" being 1
+    _number_index: Dict[Slipnode, int]
+
+    # per-node buffered activation, clamping and decay factors, indexed by Slipnode.index
+    buffers: np.ndarray
+    clamped: np.ndarray
+    _retention: np.ndarray
+    # outgoing links as parallel arrays, ordered by source node
+    _link_sources: np.ndarray
+    _link_destinations: np.ndarray
+    _link_weights: np.ndarray
+
+    # every Slipnet builds the same graph, so the arrays above are built once
+    # and shared, read-only, by all instances
+    _topology: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None
 
     # pylint: disable=too-many-instance-attributes
     def __init__(self):
         """Initializes the Slipnet instance and sets up the initial nodes and links."""
         self.__add_initial_nodes()
         self.__add_initial_links()
+        # the graph is complete; nothing adds nodes or links from here on
+        self.slipnodes = tuple(self.slipnodes)
+        self.letters = tuple(self.letters)
+        self.numbers = tuple(self.numbers)
+        self._number_index = {node: i for i, node in enumerate(self.numbers, 1)}
+        self.sliplinks = tuple(self.sliplinks)
+        self.initially_clamped_slipnodes = tuple(self.initially_clamped_slipnodes)
+        for node in self.slipnodes:
+            node.index_links()
+        self.buffers = np.zeros(len(self.slipnodes))
+        self.clamped = np.zeros(len(self.slipnodes), dtype=bool)
+        if Slipnet._topology is None:
+            Slipnet._topology = self.__build_topology()
+        (
+            self._retention,
+            self._link_sources,
+            self._link_destinations,
+            self._link_weights,
+        ) = Slipnet._topology
         self.reset()
 
     def reset(self) -> None:
@@ -111,6 +191,19 @@ class Slipnet(object):
             node.reset()
         for node in self.initially_clamped_slipnodes:
             node.clamp_high()
+        self.update = self.__update_until_unclamped
+
+    def __getstate__(self) -> dict:
+        """Returns the state to pickle, leaving out any stand-in for update()."""
+        state = self.__dict__.copy()
+        state.pop("update", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restores a pickled Slipnet, reinstalling the stand-in for update()."""
+        self.__dict__.update(state)
+        if self.number_of_updates < 50:
+            self.update = self.__update_until_unclamped
 
     def update(self, random: Randomness) -> None:
         """
@@ -120,27 +213,46 @@ class Slipnet(object):
             random (Randomness): An instance of the Randomness class for random operations.
         """
         self.number_of_updates += 1
-        if self.number_of_updates == 50:
+        nodes = self.slipnodes
+        count = len(nodes)
+        activation = np.fromiter((node.activation for node in nodes), float, count)
+        activation = _step_activations(
+            activation,
+            self.buffers,
+            self.clamped,
+            self._retention,
+            self._link_sources,
+            self._link_destinations,
+            self._link_weights,
+        )
+        values = activation.tolist()
+        jumpers = np.flatnonzero(~self.clamped & (activation > JUMP_THRESHOLD))
+        # Python's ** rather than NumPy's, which can differ in the last bit
+        for index in jumpers.tolist():
+            if random.coin_flip((values[index] / 100.0) ** 3):
+                values[index] = 100.0
+        for node, value in zip(nodes, values):
+            node.activation = value
+        self.buffers.fill(0.0)
+
+    def __update_until_unclamped(self, random: Randomness) -> None:
+        """
+        Stands in for update() after a reset, releasing the initially clamped
+        slipnodes on the 50th update. It then removes itself, so that later
+        updates go straight to update() without checking the count.
+
+        Args:
+            random (Randomness): An instance of the Randomness class for random operations.
+        """
+        if self.number_of_updates == 49:
             for node in self.initially_clamped_slipnodes:
                 node.unclamp()
-        for node in self.slipnodes:
-            node.update()
-        for node in self.slipnodes:
-            node.spread_activation()
-        for node in self.slipnodes:
-            node.add_buffer()
-            node.jump(random)
-            node.buffer = 0.0
+            del self.update
+        Slipnet.update(self, random)
 
     def is_distinguishing_descriptor(self, descriptor: Slipnode) -> bool:
         """Whether no other object of the same type has the same descriptor"""
-        if descriptor == self.letter:
-            return False
-        if descriptor == self.group:
-            return False
-        if descriptor in self.numbers:
-            return False
-        return True
+        return descriptor not in self._non_distinguishing
 
     def __add_initial_nodes(self) -> None:
         """
@@ -175,11 +287,11 @@ class Slipnet(object):
         self.letters = []
         for c in "abcdefghijklmnopqrstuvwxyz":
             slipnode = self.__add_node(c, 10.0)
-            self.letters += [slipnode]
+            self.letters.append(slipnode)
         self.numbers = []
         for c in "12345":
             slipnode = self.__add_node(c, 30.0)
-            self.numbers += [slipnode]
+            self.numbers.append(slipnode)
 
         # string positions
         self.leftmost = self.__add_node("leftmost", 40.0)
@@ -194,27 +306,27 @@ class Slipnet(object):
 
         # directions
         self.left = self.__add_node("left", 40.0)
-        self.left.codelets += ["top-down-bond-scout--direction"]
-        self.left.codelets += ["top-down-group-scout--direction"]
+        self.left.codelets.append("top-down-bond-scout--direction")
+        self.left.codelets.append("top-down-group-scout--direction")
         self.right = self.__add_node("right", 40.0)
-        self.right.codelets += ["top-down-bond-scout--direction"]
-        self.right.codelets += ["top-down-group-scout--direction"]
+        self.right.codelets.append("top-down-bond-scout--direction")
+        self.right.codelets.append("top-down-group-scout--direction")
 
         # bond types
         self.predecessor = self.__add_node("predecessor", 50.0, 60)
-        self.predecessor.codelets += ["top-down-bond-scout--category"]
+        self.predecessor.codelets.append("top-down-bond-scout--category")
         self.successor = self.__add_node("successor", 50.0, 60)
-        self.successor.codelets += ["top-down-bond-scout--category"]
+        self.successor.codelets.append("top-down-bond-scout--category")
         self.sameness = self.__add_node("sameness", 80.0)
-        self.sameness.codelets += ["top-down-bond-scout--category"]
+        self.sameness.codelets.append("top-down-bond-scout--category")
 
         # group types
         self.predecessor_group = self.__add_node("predecessorGroup", 50.0)
-        self.predecessor_group.codelets += ["top-down-group-scout--category"]
+        self.predecessor_group.codelets.append("top-down-group-scout--category")
         self.successor_group = self.__add_node("successorGroup", 50.0)
-        self.successor_group.codelets += ["top-down-group-scout--category"]
+        self.successor_group.codelets.append("top-down-group-scout--category")
         self.sameness_group = self.__add_node("samenessGroup", 80.0)
-        self.sameness_group.codelets += ["top-down-group-scout--category"]
+        self.sameness_group.codelets.append("top-down-group-scout--category")
 
         # other relations
         self.identity = self.__add_node("identity", 90.0)
@@ -227,11 +339,11 @@ class Slipnet(object):
         # categories
         self.letter_category = self.__add_node("letterCategory", 30.0)
         self.string_position_category = self.__add_node("stringPositionCategory", 70.0)
-        self.string_position_category.codelets += ["top-down-description-scout"]
+        self.string_position_category.codelets.append("top-down-description-scout")
         self.alphabetic_position_category = self.__add_node(
             "alphabeticPositionCategory", 80.0
         )
-        self.alphabetic_position_category.codelets += ["top-down-description-scout"]
+        self.alphabetic_position_category.codelets.append("top-down-description-scout")
         self.direction_category = self.__add_node("directionCategory", 70.0)
         self.bond_category = self.__add_node("bondCategory", 80.0)
         self.group_category = self.__add_node("groupCategory", 80.0)
@@ -245,6 +357,8 @@ class Slipnet(object):
             self.string_position_category,
         ]
 
+        self._non_distinguishing = frozenset([self.letter, self.group, *self.numbers])
+
     def __add_initial_links(self):
         """
         Initializes the slip links between various elements in the slipnet.
@@ -271,13 +385,15 @@ class Slipnet(object):
         # letter categories
         for letter in self.letters:
             self.__add_instance_link(self.letter_category, letter, 97.0)
-        self.__add_category_link(self.sameness_group, self.letter_category, 50.0)
+        self.__add_link(
+            self.sameness_group, self.letter_category, length=50.0, kinds=_CATEGORY_LINK
+        )
         # lengths
         for number in self.numbers:
             self.__add_instance_link(self.length, number)
         groups = [self.predecessor_group, self.successor_group, self.sameness_group]
         for group in groups:
-            self.__add_non_slip_link(group, self.length, length=95.0)
+            self.__add_link(group, self.length, length=95.0, kinds=_NON_SLIP_LINK)
         opposites = [
             (self.first, self.last),
             (self.leftmost, self.rightmost),
@@ -288,8 +404,8 @@ class Slipnet(object):
         for a, b in opposites:
             self.__add_opposite_link(a, b)
         # properties
-        self.__add_property_link(self.letters[0], self.first, 75.0)
-        self.__add_property_link(self.letters[-1], self.last, 75.0)
+        self.__add_link(self.letters[0], self.first, length=75.0, kinds=_PROPERTY_LINK)
+        self.__add_link(self.letters[-1], self.last, length=75.0, kinds=_PROPERTY_LINK)
         links = [
             # object categories
             (self.object_category, self.letter),
@@ -321,37 +437,59 @@ class Slipnet(object):
         for a, b in links:
             self.__add_instance_link(a, b)
         # link bonds to their groups
-        self.__add_non_slip_link(
-            self.sameness, self.sameness_group, label=self.group_category, length=30.0
+        self.__add_link(
+            self.sameness,
+            self.sameness_group,
+            label=self.group_category,
+            length=30.0,
+            kinds=_NON_SLIP_LINK,
         )
-        self.__add_non_slip_link(
-            self.successor, self.successor_group, label=self.group_category, length=60.0
+        self.__add_link(
+            self.successor,
+            self.successor_group,
+            label=self.group_category,
+            length=60.0,
+            kinds=_NON_SLIP_LINK,
         )
-        self.__add_non_slip_link(
+        self.__add_link(
             self.predecessor,
             self.predecessor_group,
             label=self.group_category,
             length=60.0,
+            kinds=_NON_SLIP_LINK,
         )
         # link bond groups to their bonds
-        self.__add_non_slip_link(
-            self.sameness_group, self.sameness, label=self.bond_category, length=90.0
+        self.__add_link(
+            self.sameness_group,
+            self.sameness,
+            label=self.bond_category,
+            length=90.0,
+            kinds=_NON_SLIP_LINK,
         )
-        self.__add_non_slip_link(
-            self.successor_group, self.successor, label=self.bond_category, length=90.0
+        self.__add_link(
+            self.successor_group,
+            self.successor,
+            label=self.bond_category,
+            length=90.0,
+            kinds=_NON_SLIP_LINK,
         )
-        self.__add_non_slip_link(
+        self.__add_link(
             self.predecessor_group,
             self.predecessor,
             label=self.bond_category,
             length=90.0,
+            kinds=_NON_SLIP_LINK,
         )
         # letter category to length
-        self.__add_slip_link(self.letter_category, self.length, length=95.0)
-        self.__add_slip_link(self.length, self.letter_category, length=95.0)
+        self.__add_link(
+            self.letter_category, self.length, length=95.0, kinds=_SLIP_LINK
+        )
+        self.__add_link(
+            self.length, self.letter_category, length=95.0, kinds=_SLIP_LINK
+        )
         # letter to group
-        self.__add_slip_link(self.letter, self.group, length=90.0)
-        self.__add_slip_link(self.group, self.letter, length=90.0)
+        self.__add_link(self.letter, self.group, length=90.0, kinds=_SLIP_LINK)
+        self.__add_link(self.group, self.letter, length=90.0, kinds=_SLIP_LINK)
         # direction-position, direction-neighbor, position-neighbor
         self.__add_bidirectional_link(self.left, self.leftmost, 90.0)
         self.__add_bidirectional_link(self.right, self.rightmost, 90.0)
@@ -362,8 +500,38 @@ class Slipnet(object):
         self.__add_bidirectional_link(self.leftmost, self.last, 100.0)
         self.__add_bidirectional_link(self.rightmost, self.last, 100.0)
         # other
-        self.__add_slip_link(self.single, self.whole, length=90.0)
-        self.__add_slip_link(self.whole, self.single, length=90.0)
+        self.__add_link(self.single, self.whole, length=90.0, kinds=_SLIP_LINK)
+        self.__add_link(self.whole, self.single, length=90.0, kinds=_SLIP_LINK)
+
+    def __build_topology(
+        self,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Builds the read-only arrays that update() reads: each node's decay factor,
+        and every outgoing link's source, destination and weight.
+
+        Links are listed in node order and then in each node's link order, so that
+        np.add.at accumulates into the buffers in the same order as walking the
+        links one at a time. A link's intrinsic degree of association depends only
+        on fixed lengths, so the weights never change.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The decay factors,
+                link sources, link destinations and link weights.
+        """
+        links = [link for node in self.slipnodes for link in node.outgoing_links]
+        arrays = (
+            np.array([100.0 - node.conceptual_depth for node in self.slipnodes]),
+            np.array([link.source.index for link in links], dtype=np.intp),
+            np.array([link.destination.index for link in links], dtype=np.intp),
+            np.array(
+                [link.intrinsic_degree_of_association() for link in links],
+                dtype=float,
+            ),
+        )
+        for array in arrays:
+            array.flags.writeable = False
+        return arrays
 
     def __add_link(
         self,
@@ -371,6 +539,7 @@ class Slipnet(object):
         destination: Slipnode,
         label: Optional[Slipnode] = None,
         length: float = 0.0,
+        kinds: int = 0,
     ) -> Sliplink:
         """
         Adds a link between two Slipnodes.
@@ -380,58 +549,26 @@ class Slipnet(object):
             destination (Slipnode): The destination Slipnode for the link.
             label (Optional[Slipnode], optional): An optional label for the link. Defaults to None.
             length (float, optional): The length of the link. Defaults to 0.0.
+            kinds (int, optional): A combination of the _*_LINK flags naming the source's
+                link lists that the link is also added to. Defaults to 0.
 
         Returns:
             Sliplink: The created Sliplink object connecting the source and destination Slipnodes.
         """
         link = Sliplink(source, destination, label=label, length=length)
-        self.sliplinks += [link]
+        self.sliplinks.append(link)
+        if kinds & _SLIP_LINK:
+            source.lateral_slip_links.append(link)
+        if kinds & _NON_SLIP_LINK:
+            source.lateral_non_slip_links.append(link)
+        if kinds & _CATEGORY_LINK:
+            source.category_links.append(link)
+        if kinds & _INSTANCE_LINK:
+            source.instance_links.append(link)
+        if kinds & _PROPERTY_LINK:
+            source.property_links.append(link)
         return link
 
-    def __add_slip_link(
-        self,
-        source: Slipnode,
-        destination: Slipnode,
-        label: Optional[Slipnode] = None,
-        length: float = 0.0,
-    ) -> None:
-        """
-        Adds a lateral slip link between two Slipnodes.
-
-        Parameters:
-            source (Slipnode): The source Slipnode from which the link originates.
-            destination (Slipnode): The destination Slipnode to which the link points.
-            label (Optional[Slipnode], optional): An optional label for the link. Defaults to None.
-            length (float, optional): The length of the link. Defaults to 0.0.
-
-        Returns:
-            None
-        """
-        link = self.__add_link(source, destination, label, length)
-        source.lateral_slip_links += [link]
-
-    def __add_non_slip_link(
-        self,
-        source: Slipnode,
-        destination: Slipnode,
-        label: Optional[Slipnode] = None,
-        length: float = 0.0,
-    ) -> None:
-        """
-        Adds a non-slip link between two Slipnode instances.
-
-        Parameters:
-            source (Slipnode): The source Slipnode from which the link originates.
-            destination (Slipnode): The destination Slipnode to which the link points.
-            label (Optional[Slipnode], optional): An optional label for the link. Defaults to None.
-            length (float, optional): The length of the link. Defaults to 0.0.
-
-        Returns:
-            None: This method does not return a value.
-        """
-        link = self.__add_link(source, destination, label, length)
-        source.lateral_non_slip_links += [link]
-
     def __add_bidirectional_link(
         self,
         source: Slipnode,
@@ -453,29 +590,8 @@ class Slipnet(object):
         Returns:
             None
         """
-        self.__add_non_slip_link(source, destination, length=length)
-        self.__add_non_slip_link(destination, source, length=length)
-
-    def __add_category_link(
-        self,
-        source: Slipnode,
-        destination: Slipnode,
-        length: float = 0.0,
-    ) -> None:
-        """
-        Adds a category link between two Slipnode instances.
-
-        Parameters:
-            source (Slipnode): The source Slipnode from which the link originates.
-            destination (Slipnode): The destination Slipnode to which the link points.
-            length (float, optional): The length of the link. Defaults to 0.0.
-
-        Returns:
-            None
-        """
-        # noinspection PyArgumentEqualDefault
-        link = self.__add_link(source, destination, None, length)
-        source.category_links += [link]
+        self.__add_link(source, destination, length=length, kinds=_NON_SLIP_LINK)
+        self.__add_link(destination, source, length=length, kinds=_NON_SLIP_LINK)
 
     def __add_instance_link(
         self, source: Slipnode, destination: Slipnode, length: float = 100.0
@@ -497,28 +613,10 @@ class Slipnet(object):
             the instance link.
         """
         category_length = source.conceptual_depth - destination.conceptual_depth
-        self.__add_category_link(destination, source, category_length)
-        # noinspection PyArgumentEqualDefault
-        link = self.__add_link(source, destination, None, length)
-        source.instance_links += [link]
-
-    def __add_property_link(
-        self, source: Slipnode, destination: Slipnode, length: float
-    ) -> None:
-        """
-        Adds a property link between two Slipnode instances.
-
-        Parameters:
-            source (Slipnode): The source Slipnode from which the link originates.
-            destination (Slipnode): The destination Slipnode to which the link points.
-            length (float): The length of the property link.
-
-        Returns:
-            None
-        """
-        # noinspection PyArgumentEqualDefault
-        link = self.__add_link(source, destination, None, length)
-        source.property_links += [link]
+        self.__add_link(
+            destination, source, length=category_length, kinds=_CATEGORY_LINK
+        )
+        self.__add_link(source, destination, length=length, kinds=_INSTANCE_LINK)
 
     def __add_opposite_link(self, source: Slipnode, destination: Slipnode) -> None:
         """
@@ -535,8 +633,8 @@ class Slipnet(object):
         Returns:
             None
         """
-        self.__add_slip_link(source, destination, label=self.opposite)
-        self.__add_slip_link(destination, source, label=self.opposite)
+        self.__add_link(source, destination, label=self.opposite, kinds=_SLIP_LINK)
+        self.__add_link(destination, source, label=self.opposite, kinds=_SLIP_LINK)
 
     def __add_node(self, name: str, depth: float, length: float = 0.0) -> Slipnode:
         """
@@ -551,16 +649,17 @@ class Slipnet(object):
             Slipnode: The newly created Slipnode instance.
         """
         slipnode = Slipnode(self, name, depth, length)
-        self.slipnodes += [slipnode]
+        slipnode.index = len(self.slipnodes)
+        self.slipnodes.append(slipnode)
         return slipnode
 
-    def __link_items_to_their_neighbors(self, items: List[Slipnode]) -> None:
+    def __link_items_to_their_neighbors(self, items: Sequence[Slipnode]) -> None:
         """
         Links each item in the provided list to its neighboring items.
 
         This method iterates through a list of items and establishes non-slip links
         between each item and its predecessor and successor. The links are created
-        using the `__add_non_slip_link` method, which is called twice for each
+        using the `__add_link` method, which is called twice for each
         pair of neighboring items.
 
         Parameters:
@@ -572,6 +671,10 @@ class Slipnet(object):
         """
         previous = items[0]
         for item in items[1:]:
-            self.__add_non_slip_link(previous, item, label=self.successor)
-            self.__add_non_slip_link(item, previous, label=self.predecessor)
+            self.__add_link(
+                previous, item, label=self.successor, kinds=_NON_SLIP_LINK
+            )
+            self.__add_link(
+                item, previous, label=self.predecessor, kinds=_NON_SLIP_LINK
+            )
             previous = item
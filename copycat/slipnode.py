@@ -5,13 +5,18 @@ methods for managing these attributes.
 """
 
 import math
-from typing import List, Optional
-from .randomness import Randomness
+from typing import Dict, List, Optional, Sequence
+
+# activations above this count as full, allowing for float error
+FULL_ACTIVATION = 100.0 - 0.00001
+
+# unclamped nodes above this activation may jump to full activation
+JUMP_THRESHOLD = 55.0
 
 
 def jump_threshold() -> float:
     """Returns the jump threshold value."""
-    return 55.0
+    return JUMP_THRESHOLD
 
 
 class Slipnode:
@@ -21,40 +26,82 @@ class Slipnode:
     Attributes:
         slipnet (Slipnet): The Slipnet to which this node belongs.
         name (str): The name of the node.
+        index (int): Position of the node in Slipnet.slipnodes, used to address
+            the Slipnet's per-node arrays.
         conceptual_depth (float): The conceptual depth of the node.
         intrinsic_link_length (float): The intrinsic link length of the node.
         shrunk_link_length (float): The shrunk link length of the node.
         activation (float): The activation level of the node.
-        buffer (float): The buffer value for the node.
-        clamped (bool): Indicates if the node's activation is clamped.
-        category_links (List[Sliplink]): List of category links from this node.
-        instance_links (List[Sliplink]): List of instance links from this node.
-        property_links (List[Sliplink]): List of property links from this node.
-        lateral_slip_links (List[Sliplink]): List of lateral slip links from this node.
-        lateral_non_slip_links (List[Sliplink]): List of lateral non-slip links from this node.
-        incoming_links (List[Sliplink]): List of incoming links to this node.
-        outgoing_links (List[Sliplink]): List of outgoing links from this node.
-        codelets (List[Codelet]): List of codelets associated with this node.
+        buffer (float): The buffer value for the node, kept in the Slipnet's
+            buffers array.
+        clamped (bool): Indicates if the node's activation is clamped, kept in the
+            Slipnet's clamped array.
+        category_links (Sequence[Sliplink]): The category links from this node; a tuple once
+            index_links() has run.
+        instance_links (Sequence[Sliplink]): The instance links from this node; a tuple once
+            index_links() has run.
+        property_links (Sequence[Sliplink]): The property links from this node; a tuple once
+            index_links() has run.
+        lateral_slip_links (Sequence[Sliplink]): The lateral slip links from this node; a tuple once
+            index_links() has run.
+        lateral_non_slip_links (Sequence[Sliplink]): The lateral non-slip links from this node; a tuple once
+            index_links() has run.
+        outgoing_links (Sequence[Sliplink]): The outgoing links from this node; a tuple once
+            index_links() has run.
+        codelets (Sequence[str]): Names of the codelets this node posts; a tuple once
+            index_links() has run.
+        bond_categories (Dict[Slipnode, Optional[Slipnode]]): Label of the first outgoing
+            link to each destination, built by index_links().
+        related_nodes (Dict[Optional[Slipnode], Slipnode]): Destination of the first
+            outgoing link with each label, built by index_links().
+        slip_links (Dict[Slipnode, Sliplink]): The first lateral slip link to each
+            destination, built by index_links().
     """
 
+    __slots__ = (
+        "slipnet",
+        "name",
+        "_display_name",
+        "index",
+        "conceptual_depth",
+        "intrinsic_link_length",
+        "shrunk_link_length",
+        "_intrinsic_bond_association",
+        "_shrunk_bond_association",
+        "activation",
+        "category_links",
+        "instance_links",
+        "property_links",
+        "lateral_slip_links",
+        "lateral_non_slip_links",
+        "outgoing_links",
+        "codelets",
+        "bond_categories",
+        "related_nodes",
+        "slip_links",
+    )
+
     slipnet: "Slipnet"  # type: ignore  # noqa: F821
     name: str
+    _display_name: str
+    index: int
     conceptual_depth: float
     intrinsic_link_length: float
     shrunk_link_length: float
-
-    activation: float = 0.0
-    old_activation: Optional[float] = None
-    buffer: float = 0.0
-    clamped: bool = False
-    category_links: List["Sliplink"] = []  # type: ignore  # noqa: F821
-    instance_links: List["Sliplink"] = []  # type: ignore  # noqa: F821
-    property_links: List["Sliplink"] = []  # type: ignore  # noqa: F821
-    lateral_slip_links: List["Sliplink"] = []  # type: ignore  # noqa: F821
-    lateral_non_slip_links: List["Sliplink"] = []  # type: ignore  # noqa: F821
-    incoming_links: List["Sliplink"] = []  # type: ignore  # noqa: F821
-    outgoing_links: List["Sliplink"] = []  # type: ignore  # noqa: F821
-    codelets: List["Codelet"] = []  # type: ignore  # noqa: F821
+    _intrinsic_bond_association: float
+    _shrunk_bond_association: float
+
+    activation: float
+    category_links: Sequence["Sliplink"]  # type: ignore  # noqa: F821
+    instance_links: Sequence["Sliplink"]  # type: ignore  # noqa: F821
+    property_links: Sequence["Sliplink"]  # type: ignore  # noqa: F821
+    lateral_slip_links: Sequence["Sliplink"]  # type: ignore  # noqa: F821
+    lateral_non_slip_links: Sequence["Sliplink"]  # type: ignore  # noqa: F821
+    outgoing_links: Sequence["Sliplink"]  # type: ignore  # noqa: F821
+    codelets: Sequence[str]
+    bond_categories: Dict["Slipnode", Optional["Slipnode"]]
+    related_nodes: Dict[Optional["Slipnode"], "Slipnode"]
+    slip_links: Dict["Slipnode", "Sliplink"]  # type: ignore  # noqa: F821
 
     # pylint: disable=too-many-instance-attributes
     def __init__(
@@ -66,25 +113,50 @@ class Slipnode:
     ):
         self.slipnet = slipnet
         self.name = name
+        self._display_name = name.upper() if len(name) == 1 else name
+        self.index = -1
         self.conceptual_depth = depth
         self.intrinsic_link_length = length
         self.shrunk_link_length = length * 0.4
+        # bond_degree_of_association() for each link length, which never change
+        self._intrinsic_bond_association = min(100.0, math.sqrt(100 - length) * 11.0)
+        self._shrunk_bond_association = min(
+            100.0, math.sqrt(100 - self.shrunk_link_length) * 11.0
+        )
 
         self.activation = 0.0
-        self.buffer = 0.0
-        self.clamped = False
         self.category_links = []
         self.instance_links = []
         self.property_links = []
         self.lateral_slip_links = []
         self.lateral_non_slip_links = []
-        self.incoming_links = []
         self.outgoing_links = []
         self.codelets = []
+        self.bond_categories = {}
+        self.related_nodes = {}
+        self.slip_links = {}
 
     def __repr__(self) -> str:
         return f"<Slipnode: {self.name}>"
 
+    @property
+    def buffer(self) -> float:
+        """The activation buffered for this node until the next Slipnet update."""
+        return float(self.slipnet.buffers[self.index])
+
+    @buffer.setter
+    def buffer(self, value: float) -> None:
+        self.slipnet.buffers[self.index] = value
+
+    @property
+    def clamped(self) -> bool:
+        """Whether updates leave this node's activation unchanged."""
+        return bool(self.slipnet.clamped[self.index])
+
+    @clamped.setter
+    def clamped(self, value: bool) -> None:
+        self.slipnet.clamped[self.index] = value
+
     def reset(self) -> None:
         """Resets the buffer and activation of the Slipnode."""
         self.buffer = 0.0
@@ -127,8 +199,7 @@ class Slipnode:
         Returns:
             bool: True if the Slipnode has full activation, False otherwise.
         """
-        float_margin = 0.00001
-        return self.activation > 100.0 - float_margin
+        return self.activation > FULL_ACTIVATION
 
     def bond_degree_of_association(self) -> float:
         """
@@ -137,11 +208,9 @@ class Slipnode:
         Returns:
             float: The bond degree of association.
         """
-        link_length: float = self.intrinsic_link_length
         if self.fully_active():
-            link_length = self.shrunk_link_length
-        result = math.sqrt(100 - link_length) * 11.0
-        return min(100.0, result)
+            return self._shrunk_bond_association
+        return self._intrinsic_bond_association
 
     def degree_of_association(self) -> float:
         """
@@ -165,7 +234,8 @@ class Slipnode:
         Returns:
             bool: True if the Slipnode is linked to the other Slipnode, False otherwise.
         """
-        return any(link.points_at(other) for link in self.outgoing_links)
+        # index_links() keys bond_categories by every outgoing destination
+        return other in self.bond_categories
 
     def slip_linked(self, other: "Slipnode") -> bool:
         """
@@ -177,7 +247,7 @@ class Slipnode:
         Returns:
             bool: True if the Slipnode is slip-linked to the other Slipnode, False otherwise.
         """
-        return any(link.points_at(other) for link in self.lateral_slip_links)
+        return other in self.slip_links
 
     def related(self, other: "Slipnode") -> bool:
         """
@@ -190,7 +260,7 @@ class Slipnode:
             bool: True if the Slipnode is the same as or linked to the other Slipnode,
                 False otherwise.
         """
-        return self == other or self.linked(other)
+        return self is other or self.linked(other)
 
     def apply_slippages(
         self, slippages: List["ConceptMapping"]  # type: ignore  # noqa: F821
@@ -202,7 +272,7 @@ class Slipnode:
             slippages (list): A list of slippages to apply.
         """
         for slippage in slippages:
-            if self == slippage.initialDescriptor:
+            if self is slippage.initialDescriptor:
                 return slippage.targetDescriptor
         return self
 
@@ -212,14 +282,9 @@ class Slipnode:
         If no linked node is found, return None
         """
         slipnet: "Slipnet" = self.slipnet  # type: ignore  # noqa: F821
-        if relation == slipnet.identity:
+        if relation is slipnet.identity:
             return self
-        destinations = [
-            link.destination for link in self.outgoing_links if link.label == relation
-        ]
-        if destinations:
-            return destinations[0]
-        return None
+        return self.related_nodes.get(relation)
 
     def get_bond_category(self, destination: "Slipnode") -> Optional["Slipnode"]:
         """Return the label of the link between these nodes if it exists.
@@ -227,46 +292,31 @@ class Slipnode:
         If it does not exist return None
         """
         slipnet: "Slipnet" = self.slipnet  # type: ignore  # noqa: F821
-        if self == destination:
+        if self is destination:
             return slipnet.identity
-        else:
-            for link in self.outgoing_links:
-                if link.destination == destination:
-                    return link.label
-        return None
-
-    def update(self) -> None:
-        """Updates the activation buffer of the Slipnode."""
-        self.old_activation = self.activation
-        self.buffer -= self.activation * (100.0 - self.conceptual_depth) / 100.0
-
-    def spread_activation(self) -> None:
-        """Spreads activation to outgoing links if the Slipnode is fully active."""
-        if self.fully_active():
-            for link in self.outgoing_links:
-                link.spread_activation()
+        return self.bond_categories.get(destination)
 
-    def add_buffer(self) -> None:
-        """Adds the buffer value to the activation and clamps it between 0 and 100."""
-        if self.unclamped():
-            self.activation += self.buffer
-        self.activation = min(max(0, self.activation), 100)
-
-    def jump(self, random: Randomness) -> None:
+    def index_links(self) -> None:
         """
-        Determines if the Slipnode should jump to full activation based on a random value.
-
-        Args:
-            random: An object with a coin_flip method to determine randomness.
+        Freezes this node's (now complete) link and codelet lists into tuples and
+        builds the lookup tables over its outgoing links.
         """
-        if self.clamped or self.activation <= jump_threshold():
-            return
-        value = (self.activation / 100.0) ** 3
-        if random.coin_flip(value):
-            self.activation = 100.0
+        self.category_links = tuple(self.category_links)
+        self.instance_links = tuple(self.instance_links)
+        self.property_links = tuple(self.property_links)
+        self.lateral_slip_links = tuple(self.lateral_slip_links)
+        self.lateral_non_slip_links = tuple(self.lateral_non_slip_links)
+        self.outgoing_links = tuple(self.outgoing_links)
+        self.codelets = tuple(self.codelets)
+        self.bond_categories = {}
+        self.related_nodes = {}
+        for link in self.outgoing_links:
+            self.bond_categories.setdefault(link.destination, link.label)
+            self.related_nodes.setdefault(link.label, link.destination)
+        self.slip_links = {}
+        for link in self.lateral_slip_links:
+            self.slip_links.setdefault(link.destination, link)
 
     def get_name(self) -> str:
         """returns the node name"""
-        if len(self.name) == 1:
-            return self.name.upper()
-        return self.name
+        return self._display_name
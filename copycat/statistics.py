@@ -8,43 +8,42 @@ Returns:
     _type_: _description_
 """
 from collections import defaultdict
+from functools import partial
 from math import log
 
-# comparison values for n degrees freedom
+# comparison values for n degrees freedom, indexed by n (there is no entry for 0)
 # These values are useable for both the chi^2 and G tests
-
-_ptable = {
-    1: 3.841,
-    2: 5.991,
-    3: 7.815,
-    4: 9.488,
-    5: 11.071,
-    6: 12.592,
-    7: 14.067,
-    8: 15.507,
-    9: 16.919,
-    10: 18.307,
-    11: 19.7,
-    12: 21,
-    13: 22.4,
-    14: 23.7,
-    15: 25,
-    16: 26.3,
-}
-
-
-_get_count = lambda k, d: d[k]["count"] if k in d else 0
+_ptable = (
+    None,
+    3.841,
+    5.991,
+    7.815,
+    9.488,
+    11.071,
+    12.592,
+    14.067,
+    15.507,
+    16.919,
+    18.307,
+    19.7,
+    21,
+    22.4,
+    23.7,
+    25,
+    26.3,
+)
 
 
 def g_value(actual, expected):
     # G = 2 * sum(Oi * ln(Oi/Ei))
-    answerKeys = set(list(actual.keys()) + list(expected.keys()))
+    answerKeys = actual.keys() | expected.keys()
     degreesFreedom = len(answerKeys)
     G = 0
 
+    # a handful of answers at most, too few for arrays to pay off
     for k in answerKeys:
-        E = _get_count(k, expected)
-        O = _get_count(k, actual)
+        E = expected[k]["count"] if k in expected else 0
+        O = actual[k]["count"] if k in actual else 0
         if E == 0:
             print("    Warning! Expected 0 counts of {}, but got {}".format(k, O))
         elif O == 0:
@@ -56,13 +55,13 @@ def g_value(actual, expected):
 
 
 def chi_value(actual, expected):
-    answerKeys = set(list(actual.keys()) + list(expected.keys()))
+    answerKeys = actual.keys() | expected.keys()
     degreesFreedom = len(answerKeys)
     chiSquared = 0
 
     for k in answerKeys:
-        E = _get_count(k, expected)
-        O = _get_count(k, actual)
+        E = expected[k]["count"] if k in expected else 0
+        O = actual[k]["count"] if k in actual else 0
         if E == 0:
             print("    Warning! Expected 0 counts of {}, but got {}".format(k, O))
         else:
@@ -71,24 +70,16 @@ def chi_value(actual, expected):
 
 
 def probability_difference(actual, expected):
-    actualC = 0
-    expectedC = 0
-
-    for k in set(list(actual.keys()) + list(expected.keys())):
-        expectedC += _get_count(k, expected)
-        actualC += _get_count(k, actual)
-
-    p = 0
-
-    Et = 0
-    Ot = 0
+    answerKeys = actual.keys() | expected.keys()
+    counts = [
+        (actual[k]["count"] if k in actual else 0,
+         expected[k]["count"] if k in expected else 0)
+        for k in answerKeys
+    ]
+    actualC = sum(O for O, _ in counts)
+    expectedC = sum(E for _, E in counts)
 
-    for k in set(list(actual.keys()) + list(expected.keys())):
-        E = _get_count(k, expected)
-        O = _get_count(k, actual)
-        Ep = E / expectedC
-        Op = O / actualC
-        p += abs(Ep - Op)
+    p = sum(abs(E / expectedC - O / actualC) for O, E in counts)
 
     p /= 2  # P is between 0 and 2 -> P is between 0 and 1
 
@@ -97,7 +88,7 @@ def probability_difference(actual, expected):
 
 def dist_test(actual, expected, calculation):
     df, p = calculation(actual, expected)
-    if df not in _ptable:
+    if not 0 < df < len(_ptable):
         raise Exception(
             "{} degrees of freedom does not have a corresponding chi squared value."
             + " Please look up the value and add it to the table in copycat/statistics.py".format(
@@ -108,13 +99,14 @@ def dist_test(actual, expected, calculation):
 
 
 def cross_formula_table(actualDict, expectedDict, calculation, probs=False):
+    if probs:
+        compare = probability_difference
+    else:
+        compare = partial(dist_test, calculation=calculation)
     data = dict()
     for ka, actual in actualDict.items():
         for ke, expected in expectedDict.items():
-            if probs:
-                data[(ka, ke)] = probability_difference(actual, expected)
-            else:
-                data[(ka, ke)] = dist_test(actual, expected, calculation)
+            data[(ka, ke)] = compare(actual, expected)
     return data
 
 
@@ -122,18 +114,17 @@ def cross_table(problemSets, calculation=g_value, probs=False):
     table = defaultdict(dict)
     for i, (a, problemSetA) in enumerate(problemSets):
         for b, problemSetB in problemSets[i + 1 :]:
+            # later duplicates win, as they did when every pair was compared
+            indexB = {(p.initial, p.modified, p.target): p for p in problemSetB}
             for problemA in problemSetA:
-                for problemB in problemSetB:
-                    if (
-                        problemA.initial == problemB.initial
-                        and problemA.modified == problemB.modified
-                        and problemA.target == problemB.target
-                    ):
-                        answersA = problemA.distributions
-                        answersB = problemB.distributions
-                        table[(problemA.initial, problemA.modified, problemA.target)][
-                            (a, b)
-                        ] = cross_formula_table(answersA, answersB, calculation, probs)
+                key = (problemA.initial, problemA.modified, problemA.target)
+                problemB = indexB.get(key)
+                if problemB is not None:
+                    answersA = problemA.distributions
+                    answersB = problemB.distributions
+                    table[key][(a, b)] = cross_formula_table(
+                        answersA, answersB, calculation, probs
+                    )
     return table
 
 
@@ -102,8 +102,6 @@ def _none(temp, prob):
 
 class Temperature(object):
     def __init__(self):
-        self.reset()
-        self.adjustmentType = 'inverse'
         self._adjustmentFormulas = {
                 'original'       : _original,
                 'entropy'        : _entropy,
@@ -119,15 +117,21 @@ class Temperature(object):
                 'meta'           : _meta,
                 'pmeta'          : _meta_parameterized,
                 'none'           : _none}
-        self.diffs  = 0
-        self.ndiffs = 0
+        self.reset()
 
-    def reset(self):
+    def reset(self, new_run=True):
+        # A new run also goes back to the default formula and drops the
+        # adjustment statistics; resetting between trials keeps both
+        if new_run:
+            self.adjustmentType = 'inverse'
+            self.diffs  = 0
+            self.ndiffs = 0
         self.history = [100.0]
         self.actual_value = 100.0
         self.last_unclamped_value = 100.0
         self.clamped = True
         self.clampTime = 30
+        self.__valueChanged()
 
     def update(self, value):
         self.last_unclamped_value = value
@@ -136,21 +140,29 @@ class Temperature(object):
         else:
             self.history.append(value)
             self.actual_value = value
+        self.__valueChanged()
 
     def clampUntil(self, when):
         self.clamped = True
         self.clampTime = when
         # but do not modify self.actual_value until someone calls update()
+        self.__valueChanged()
 
     def tryUnclamp(self, currentTime):
         if self.clamped and currentTime >= self.clampTime:
             self.clamped = False
+            self.__valueChanged()
+
+    def __valueChanged(self):
+        # getAdjustedValue's exponent depends only on value(), so work it out
+        # here rather than once per adjusted salience
+        self._adjustedValueExponent = ((100.0 - self.value()) / 30.0) + 0.5
 
     def value(self):
         return 100.0 if self.clamped else self.actual_value
 
     def getAdjustedValue(self, value):
-        return value ** (((100.0 - self.value()) / 30.0) + 0.5)
+        return value ** self._adjustedValueExponent
 
     def getAdjustedProbability(self, value):
         temp = self.value()
@@ -1,6 +1,6 @@
 """Workspace module.
 
-This module defines the `Workspace` class and associated functions for managing and 
+This module defines the `Workspace` class for managing and 
 assessing the state of a workspace in the context of the Copycat project. The workspace 
 tracks various strings, objects, and structures, and provides methods to calculate 
 unhappiness metrics, update object states, and manage rules and descriptions.
@@ -8,38 +8,12 @@ unhappiness metrics, update object states, and manage rules and descriptions.
 Classes:
     Workspace: Represents the workspace, containing methods to manage strings, objects, 
                structures, and calculate various metrics.
-
-Functions:
-    __adjust_unhappiness(values: Iterable[float]) -> float: Adjusts the unhappiness value 
-                                                           based on the provided iterable 
-                                                           of float values.
 """
 
-from typing import Any, Iterable, List, Optional
+from typing import Any, List, Optional, Set
 from . import formulas
-from .bond import Bond
-from .correspondence import Correspondence
-from .letter import Letter
 from .workspace_string import WorkspaceString
-
-
-def __adjust_unhappiness(values: Iterable[float]) -> float:
-    """
-    Adjusts the unhappiness value based on the provided iterable of float values.
-
-    This function calculates the sum of the provided values, divides the sum by 2,
-    and ensures that the result does not exceed 100.0.
-
-    Args:
-        values (Iterable[float]): An iterable of float values representing unhappiness metrics.
-
-    Returns:
-        float: The adjusted unhappiness value, capped at a maximum of 100.0.
-    """
-    result = sum(values) / 2
-    if result > 100.0:
-        result = 100.0
-    return result
+from .workspace_structure import KIND_BOND, KIND_CORRESPONDENCE, KIND_LETTER
 
 
 class Workspace(object):
@@ -67,6 +41,10 @@ class Workspace(object):
         __repr__(): Returns a string representation of the workspace.
         reset_with_strings(initial, modified, target): Resets the workspace with the given strings.
         reset(): Resets the workspace to its initial state.
+        add_object(objekt), remove_object(objekt), has_object(objekt): Maintain the
+            objects list together with its membership set.
+        add_structure(structure), remove_structure(structure), has_structure(structure):
+            Maintain the structures list together with its membership set.
         assess_unhappiness(): Assesses the unhappiness scores.
         calculate_intra_string_unhappiness(): Calculates the intra-string unhappiness score.
         calculate_inter_string_unhappiness(): Calculates the inter-string unhappiness score.
@@ -85,6 +63,7 @@ class Workspace(object):
         build_rule(rule): Builds and activates a rule in the workspace.
         break_rule(): Breaks the current rule in the workspace.
         build_descriptions(objekt): Builds descriptions for the given object.
+        build_new_descriptions(objekt): Builds the descriptions of a newly created object.
     """
 
     ctx: "Copycat"  # type: ignore  # noqa: F821
@@ -101,6 +80,15 @@ class Workspace(object):
     structures: List[Any]
     rule: Optional[Any]
 
+    # Mirrors of `objects` and `structures` for O(1) membership tests, plus
+    # the typed subsets the counting methods need; keep them in step by
+    # mutating the lists only through add_*/remove_*.
+    _object_set: Set[Any]
+    _structure_set: Set[Any]
+    _letters: List[Any]
+    _bonds: List[Any]
+    _correspondences: List[Any]
+
     initial: Optional[WorkspaceString] = None
     modified: Optional[WorkspaceString] = None
     target: Optional[WorkspaceString] = None
@@ -120,6 +108,11 @@ class Workspace(object):
         self.changed_object = None
         self.objects = []
         self.structures = []
+        self._object_set = set()
+        self._structure_set = set()
+        self._letters = []
+        self._bonds = []
+        self._correspondences = []
         self.rule = None
 
     def __repr__(self) -> str:
@@ -157,12 +150,60 @@ class Workspace(object):
         self.changed_object = None
         self.objects = []
         self.structures = []
+        self._object_set = set()
+        self._structure_set = set()
+        self._letters = []
+        self._bonds = []
+        self._correspondences = []
         self.rule = None  # Only one rule? : LSaldyt
         self.initial = WorkspaceString(self.ctx, self.initial_string)
         self.modified = WorkspaceString(self.ctx, self.modified_string)
         self.target = WorkspaceString(self.ctx, self.target_string)
 
-    # TODO: Extract method?
+    def add_object(self, objekt: "WorkspaceObject") -> None:  # type: ignore  # noqa: F821
+        """Adds an object to the workspace."""
+        self.objects.append(objekt)
+        self._object_set.add(objekt)
+        if objekt._kind == KIND_LETTER:
+            self._letters.append(objekt)
+
+    def remove_object(self, objekt: "WorkspaceObject") -> None:  # type: ignore  # noqa: F821
+        """Removes an object from the workspace, if it is present."""
+        if objekt in self._object_set:
+            self._object_set.discard(objekt)
+            self.objects.remove(objekt)
+            if objekt._kind == KIND_LETTER:
+                self._letters.remove(objekt)
+
+    def has_object(self, objekt: "WorkspaceObject") -> bool:  # type: ignore  # noqa: F821
+        """Whether the object is currently in the workspace."""
+        return objekt in self._object_set
+
+    def add_structure(self, structure: "WorkspaceStructure") -> None:  # type: ignore  # noqa: F821
+        """Adds a structure to the workspace."""
+        self.structures.append(structure)
+        self._structure_set.add(structure)
+        kind = structure._kind
+        if kind == KIND_BOND:
+            self._bonds.append(structure)
+        elif kind == KIND_CORRESPONDENCE:
+            self._correspondences.append(structure)
+
+    def remove_structure(self, structure: "WorkspaceStructure") -> None:  # type: ignore  # noqa: F821
+        """Removes a structure from the workspace, if it is present."""
+        if structure in self._structure_set:
+            self._structure_set.discard(structure)
+            self.structures.remove(structure)
+            kind = structure._kind
+            if kind == KIND_BOND:
+                self._bonds.remove(structure)
+            elif kind == KIND_CORRESPONDENCE:
+                self._correspondences.remove(structure)
+
+    def has_structure(self, structure: "WorkspaceStructure") -> bool:  # type: ignore  # noqa: F821
+        """Whether the structure is currently in the workspace."""
+        return structure in self._structure_set
+
     def assess_unhappiness(self) -> None:
         """
         Assess and update the unhappiness metrics for the objects in the workspace.
@@ -179,82 +220,65 @@ class Workspace(object):
             inter_string_unhappiness (float): Adjusted inter-string unhappiness.
             total_unhappiness (float): Adjusted total unhappiness.
         """
-        self.intra_string_unhappiness = __adjust_unhappiness(
-            objekt.relativeImportance * objekt.intraStringUnhappiness
-            for objekt in self.objects
-        )
-        self.inter_string_unhappiness = __adjust_unhappiness(
-            objekt.relativeImportance * objekt.interStringUnhappiness
-            for objekt in self.objects
-        )
-        self.total_unhappiness = __adjust_unhappiness(
-            objekt.relativeImportance * objekt.totalUnhappiness
-            for objekt in self.objects
-        )
+        self._recalc_unhappiness()
+
+    def _recalc_unhappiness(self) -> None:
+        """
+        Recalculate the intra-string, inter-string and total unhappiness in one pass.
+
+        Each score is the sum of every object's `relativeImportance` times the
+        matching unhappiness, divided by 2.0 and capped at 100.0.
+
+        Returns:
+            None
+        """
+        if not self.objects:
+            self.intra_string_unhappiness = 0.0
+            self.inter_string_unhappiness = 0.0
+            self.total_unhappiness = 0.0
+            return
+        intra = inter = total = 0.0
+        for objekt in self.objects:
+            importance = objekt.relativeImportance
+            intra += importance * objekt.intraStringUnhappiness
+            inter += importance * objekt.interStringUnhappiness
+            total += importance * objekt.totalUnhappiness
+        self.intra_string_unhappiness = min(intra / 2.0, 100.0)
+        self.inter_string_unhappiness = min(inter / 2.0, 100.0)
+        self.total_unhappiness = min(total / 2.0, 100.0)
 
-    # TODO: these 3 methods seem to be the same... are they?  If so, Extract method.
     def calculate_intra_string_unhappiness(self) -> None:
         """
-        Calculate and update the intra-string unhappiness for the current object.
+        Calculate and update the intra-string unhappiness.
 
-        This method computes the intra-string unhappiness by summing the product
-        of `relativeImportance` and `intraStringUnhappiness` for each object in
-        `self.objects`, then dividing the result by 2.0. The computed value is
-        then assigned to `self.intra_string_unhappiness`, ensuring it does not
-        exceed 100.0.
+        Kept for callers that want a single score; see `_recalc_unhappiness`.
 
         Returns:
             None
         """
-        value = (
-            sum(
-                objekt.relativeImportance * objekt.intraStringUnhappiness
-                for objekt in self.objects
-            )
-            / 2.0
-        )
-        self.intra_string_unhappiness = min(value, 100.0)
+        self._recalc_unhappiness()
 
     def calculate_inter_string_unhappiness(self) -> None:
         """
-        Calculates the inter-string unhappiness for the objects in the workspace.
+        Calculate and update the inter-string unhappiness.
 
-        This method computes the inter-string unhappiness by summing the product
-        of `relativeImportance` and `interStringUnhappiness` for each object in
-        `self.objects`, then dividing the sum by 2.0. The result is assigned to
-        `self.inter_string_unhappiness`, capped at a maximum value of 100.0.
+        Kept for callers that want a single score; see `_recalc_unhappiness`.
 
         Returns:
             None
         """
-        value = (
-            sum(
-                objekt.relativeImportance * objekt.interStringUnhappiness
-                for objekt in self.objects
-            )
-            / 2.0
-        )
-        self.inter_string_unhappiness = min(value, 100.0)
+        self._recalc_unhappiness()
 
     def calculate_total_unhappiness(self) -> None:
         """
-        Calculate the total unhappiness for all objects and update the total_unhappiness attribute.
+        Calculate and update the total unhappiness.
 
-        The total unhappiness is computed as the sum of the product of each object's
-        relative importance and total unhappiness, divided by 2. The result is then
-        capped at a maximum value of 100.0.
+        Kept for callers that want a single score; see `_recalc_unhappiness`.
 
         Returns:
             None
         """
-        value = (
-            sum(
-                objekt.relativeImportance * objekt.totalUnhappiness
-                for objekt in self.objects
-            )
-            / 2.0
-        )
-        self.total_unhappiness = min(value, 100.0)
+        self._recalc_unhappiness()
 
     def update_everything(self) -> None:
         """
@@ -296,9 +320,7 @@ class Workspace(object):
         Returns:
             float: The updated temperature.
         """
-        self.calculate_intra_string_unhappiness()
-        self.calculate_inter_string_unhappiness()
-        self.calculate_total_unhappiness()
+        self._recalc_unhappiness()
         if self.rule:
             self.rule.update_strength()
             rule_weakness = 100.0 - self.rule.total_strength
@@ -321,19 +343,17 @@ class Workspace(object):
         Returns:
             int: The number of objects with at least one open bond slot.
         """
-        objects = [
-            objekt
+        initial, target = self.initial, self.target
+        return sum(
+            1
             for objekt in self.objects
-            if objekt.string == self.initial or objekt.string == self.target
-        ]
-        objects = [objekt for objekt in objects if not objekt.spansString()]
-        objects = [
-            objekt
-            for objekt in objects
-            if (not objekt.leftBond and not objekt.leftmost)
-            or (not objekt.rightBond and not objekt.rightmost)
-        ]
-        return len(objects)
+            if (objekt.string is initial or objekt.string is target)
+            and not objekt.spansString()
+            and (
+                (not objekt.leftBond and not objekt.leftmost)
+                or (not objekt.rightBond and not objekt.rightmost)
+            )
+        )
 
     def number_of_ungrouped_objects(self) -> int:
         """
@@ -349,35 +369,32 @@ class Workspace(object):
         Returns:
             int: The number of ungrouped objects in the workspace.
         """
-        objects = [
-            objekt
+        initial, target = self.initial, self.target
+        return sum(
+            1
             for objekt in self.objects
-            if objekt.string == self.initial or objekt.string == self.target
-        ]
-        objects = [o for o in objects if not o.spansString()]
-        objects = [o for o in objects if not o.group]
-        return len(objects)
+            if (objekt.string is initial or objekt.string is target)
+            and not objekt.spansString()
+            and not objekt.group
+        )
 
     def number_of_unreplaced_objects(self) -> int:
         """A list of all unreplaced objects in the initial string.
 
         Calculate the number of unreplaced objects in the initial string.
 
-        This method filters the objects in the `self.objects` list to find those
-        that match the initial string and are instances of the `Letter` class.
-        It then further filters these objects to include only those that do not
-        have a replacement.
+        This method filters the workspace's letters to find those that belong
+        to the initial string and do not have a replacement.
 
         Returns:
             int: The number of unreplaced objects in the initial string.
         """
-        objects = [
-            objekt
-            for objekt in self.objects
-            if objekt.string == self.initial and isinstance(objekt, Letter)
-        ]
-        objects = [o for o in objects if not o.replacement]
-        return len(objects)
+        initial = self.initial
+        return sum(
+            1
+            for objekt in self._letters
+            if objekt.string is initial and not objekt.replacement
+        )
 
     def number_of_uncorresponding_objects(self) -> int:
         """A list of all uncorresponded objects in the initial string.
@@ -390,13 +407,13 @@ class Workspace(object):
         Returns:
             int: The number of uncorresponded objects in the initial string.
         """
-        objects = [
-            objekt
+        initial, target = self.initial, self.target
+        return sum(
+            1
             for objekt in self.objects
-            if objekt.string == self.initial or objekt.string == self.target
-        ]
-        objects = [objekt for objekt in objects if not objekt.correspondence]
-        return len(objects)
+            if (objekt.string is initial or objekt.string is target)
+            and not objekt.correspondence
+        )
 
     def number_of_bonds(self) -> int:
         """The number of bonds in the workspace.
@@ -406,7 +423,7 @@ class Workspace(object):
         Returns:
             int: The total number of Bond instances in the workspace's structures.
         """
-        return sum(1 for structure in self.structures if isinstance(structure, Bond))
+        return len(self._bonds)
 
     def correspondences(self) -> List["WorkspaceStructure"]:  # type: ignore  # noqa: F821
         """
@@ -416,11 +433,7 @@ class Workspace(object):
             List[WorkspaceStructure]: A list of structures that are instances of the
                 Correspondence class.
         """
-        return [
-            structure
-            for structure in self.structures
-            if isinstance(structure, Correspondence)
-        ]
+        return list(self._correspondences)
 
     def slippages(self) -> List["ConceptMapping"]:  # type: ignore  # noqa: F821
         """
@@ -435,14 +448,21 @@ class Workspace(object):
             List[ConceptMapping]: A list of ConceptMapping objects representing the slippages.
         """
         result: List["ConceptMapping"] = []  # type: ignore  # noqa: F821
-        if self.changed_object and self.changed_object.correspondence:
-            result += self.changed_object.correspondence.conceptMappings
+        changed = self.changed_object
+        correspondence = changed.correspondence if changed else None
+        if correspondence:
+            result.extend(correspondence.conceptMappings)
+        near_keys = {mapping.nearKey for mapping in result}
         if self.initial is not None:
             for objekt in self.initial.objects:
-                if objekt.correspondence:
-                    for mapping in objekt.correspondence.slippages():
-                        if not mapping.isNearlyContainedBy(result):
-                            result += [mapping]
+                correspondence = objekt.correspondence
+                if correspondence:
+                    for mapping in correspondence.slippages():
+                        # same test as mapping.isNearlyContainedBy(result, near_keys)
+                        near_key = mapping.nearKey
+                        if near_key not in near_keys:
+                            result.append(mapping)
+                            near_keys.add(near_key)
         return result
 
     def build_rule(self, rule: "Rule") -> None:  # type: ignore  # noqa: F821
@@ -456,9 +476,9 @@ class Workspace(object):
             None
         """
         if self.rule is not None:
-            self.structures.remove(self.rule)
+            self.remove_structure(self.rule)
         self.rule = rule
-        self.structures += [rule]
+        self.add_structure(rule)
         rule.activateRuleDescriptions()
 
     def break_rule(self) -> None:
@@ -469,7 +489,7 @@ class Workspace(object):
         from the structures list and then sets the rule attribute to None.
         """
         if self.rule is not None:
-            self.structures.remove(self.rule)
+            self.remove_structure(self.rule)
         self.rule = None
 
     def build_descriptions(self, objekt: "WorkspaceObject") -> None:  # type: ignore  # noqa: F821
@@ -486,5 +506,23 @@ class Workspace(object):
         for description in objekt.descriptions:
             description.descriptionType.buffer = 100.0
             description.descriptor.buffer = 100.0
-            if description not in self.structures:
-                self.structures += [description]
+            if description not in self._structure_set:
+                self.add_structure(description)
+
+    def build_new_descriptions(self, objekt: "WorkspaceObject") -> None:  # type: ignore  # noqa: F821
+        """
+        Like `build_descriptions`, for an object whose descriptions were all just created.
+
+        None of them can be in the structures list yet, so they are added without
+        a membership check. `WorkspaceString` uses this for its freshly made letters.
+
+        Args:
+            objekt (WorkspaceObject): The newly created object whose descriptions to build.
+
+        Returns:
+            None
+        """
+        for description in objekt.descriptions:
+            description.descriptionType.buffer = 100.0
+            description.descriptor.buffer = 100.0
+            self.add_structure(description)
@@ -46,10 +46,9 @@ def __choose_object_from_list(
     """
     # TODO: use entropy
     random = ctx.random
-    temperature = ctx.temperature
-    weights = [
-        temperature.getAdjustedValue(getattr(objekt, attribute)) for objekt in objects
-    ]
+    adjusted = ctx.temperature.getAdjustedValue
+    # weighted_choice accumulates lazily, so the weights never become a list
+    weights = (adjusted(getattr(objekt, attribute)) for objekt in objects)
     return random.weighted_choice(objects, weights)
 
 
@@ -84,9 +83,18 @@ def choose_neighbor(ctx, source: WorkspaceObject) -> WorkspaceObject:
         WorkspaceObject: A neighboring object that is beside the source object,
                          selected based on the "intraStringSalience" criterion.
     """
-    workspace = ctx.workspace
-    objects = [objekt for objekt in workspace.objects if objekt.beside(source)]
-    return __choose_object_from_list(ctx, objects, "intraStringSalience")
+    # a string's objects are the workspace objects from that string, kept in
+    # the same order, so scanning them picks from the same candidate list
+    adjusted = ctx.temperature.getAdjustedValue
+    before, after = source.leftIndex - 1, source.rightIndex + 1
+    # filter and weight in one pass; same test as objekt.beside(source)
+    objects = []
+    weights = []
+    for objekt in source.string.objects:
+        if objekt.leftIndex == after or objekt.rightIndex == before:
+            objects.append(objekt)
+            weights.append(adjusted(objekt.intraStringSalience))
+    return ctx.random.weighted_choice(objects, weights)
 
 
 def choose_directed_neighbor(
@@ -104,19 +112,19 @@ def choose_directed_neighbor(
         Object: The chosen neighbor object based on the specified direction and salience.
     """
     slipnet = ctx.slipnet
-    workspace = ctx.workspace
-    if direction == slipnet.left:
-        objects = [
-            objekt
-            for objekt in workspace.objects
-            if objekt.string == source.string
-            and source.leftIndex == objekt.rightIndex + 1
-        ]
+    adjusted = ctx.temperature.getAdjustedValue
+    objects = []
+    weights = []
+    if direction is slipnet.left:
+        before = source.leftIndex - 1
+        for objekt in source.string.objects:
+            if objekt.rightIndex == before:
+                objects.append(objekt)
+                weights.append(adjusted(objekt.intraStringSalience))
     else:
-        objects = [
-            objekt
-            for objekt in workspace.objects
-            if objekt.string == source.string
-            and objekt.leftIndex == source.rightIndex + 1
-        ]
-    return __choose_object_from_list(ctx, objects, "intraStringSalience")
+        after = source.rightIndex + 1
+        for objekt in source.string.objects:
+            if objekt.leftIndex == after:
+                objects.append(objekt)
+                weights.append(adjusted(objekt.intraStringSalience))
+    return ctx.random.weighted_choice(objects, weights)
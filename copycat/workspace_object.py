@@ -1,13 +1,28 @@
 from .description import Description
-from .formulas import weighted_average
-from .workspace_structure import WorkspaceStructure
+from .workspace_structure import KIND_GROUP, WorkspaceStructure
 
 class WorkspaceObject(WorkspaceStructure):
     # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        'descriptions', '_descriptionKeys', '_descriptorByType',
+        '_typeByDescriptor', 'bonds', 'group', 'changed',
+        'correspondence', 'rawImportance', 'relativeImportance',
+        'leftBond', 'rightBond', 'name', 'replacement',
+        'rightIndex', 'leftIndex', 'leftmost', 'rightmost', '_spans', '_letterSpan',
+        'intraStringSalience', 'interStringSalience', 'totalSalience',
+        'intraStringUnhappiness', 'interStringUnhappiness', 'totalUnhappiness',
+    )
+
     def __init__(self, workspaceString):
         WorkspaceStructure.__init__(self, workspaceString.ctx)
         self.string = workspaceString
         self.descriptions = []
+        # indexes over descriptions: every (descriptionType, descriptor) pair,
+        # and the first match either way round for getDescriptor and
+        # getDescriptionType; change descriptions only via the methods below
+        self._descriptionKeys = set()
+        self._descriptorByType = {}
+        self._typeByDescriptor = {}
         self.bonds = []
         self.group = None
         self.changed = False
@@ -22,6 +37,8 @@ class WorkspaceObject(WorkspaceStructure):
         self.leftIndex = 0
         self.leftmost = False
         self.rightmost = False
+        self._spans = False
+        self._letterSpan = 1
         self.intraStringSalience = 0.0
         self.interStringSalience = 0.0
         self.totalSalience = 0.0
@@ -32,17 +49,55 @@ class WorkspaceObject(WorkspaceStructure):
     def __str__(self):
         return 'object'
 
+    def _setExtent(self, leftIndex, rightIndex, length):
+        # an object's extent never changes once placed, so neither do these
+        self.leftIndex = leftIndex
+        self.rightIndex = rightIndex
+        self.leftmost = leftIndex == 1
+        self.rightmost = rightIndex == length
+        self._spans = self.leftmost and self.rightmost
+        self._letterSpan = rightIndex - leftIndex + 1
+
     def spansString(self):
-        return self.leftmost and self.rightmost
+        return self._spans
 
     def addDescription(self, descriptionType, descriptor):
         description = Description(self, descriptionType, descriptor)
-        self.descriptions += [description]
+        self.attachDescription(description)
+
+    def attachDescription(self, description):
+        descriptionType = description.descriptionType
+        descriptor = description.descriptor
+        self.descriptions.append(description)
+        self._descriptionKeys.add((descriptionType, descriptor))
+        self._descriptorByType.setdefault(descriptionType, descriptor)
+        self._typeByDescriptor.setdefault(descriptor, descriptionType)
+
+    def detachDescription(self, description):
+        self.descriptions.remove(description)
+        # another description may share a key, so rebuild rather than discard
+        descriptions = self.descriptions
+        self.descriptions = []
+        self._descriptionKeys = set()
+        self._descriptorByType = {}
+        self._typeByDescriptor = {}
+        for d in descriptions:
+            self.attachDescription(d)
+
+    def clearDescriptions(self):
+        """Drops every description, returning the ones that were attached."""
+        descriptions = self.descriptions
+        self.descriptions = []
+        self._descriptionKeys = set()
+        self._descriptorByType = {}
+        self._typeByDescriptor = {}
+        return descriptions
 
     def addDescriptions(self, descriptions):
         workspace = self.ctx.workspace
-        copy = descriptions[:]  # in case we add to our own descriptions
-        for description in copy:
+        # bounded by the starting length in case we add to our own descriptions
+        for i in range(len(descriptions)):
+            description = descriptions[i]
             if not self.containsDescription(description):
                 self.addDescription(description.descriptionType,
                                     description.descriptor)
@@ -75,25 +130,28 @@ class WorkspaceObject(WorkspaceStructure):
     def updateValue(self):
         self.rawImportance = self.__calculateRawImportance()
         intraStringHappiness = self.__calculateIntraStringHappiness()
-        self.intraStringUnhappiness = 100.0 - intraStringHappiness
+        intraStringUnhappiness = 100.0 - intraStringHappiness
+        self.intraStringUnhappiness = intraStringUnhappiness
 
         interStringHappiness = 0.0
         if self.correspondence:
             interStringHappiness = self.correspondence.total_strength
-        self.interStringUnhappiness = 100.0 - interStringHappiness
+        interStringUnhappiness = 100.0 - interStringHappiness
+        self.interStringUnhappiness = interStringUnhappiness
 
         averageHappiness = (intraStringHappiness + interStringHappiness) / 2
         self.totalUnhappiness = 100.0 - averageHappiness
 
-        self.intraStringSalience = weighted_average((
-            (self.relativeImportance, 0.2),
-            (self.intraStringUnhappiness, 0.8)
-        ))
-        self.interStringSalience = weighted_average((
-            (self.relativeImportance, 0.8),
-            (self.interStringUnhappiness, 0.2)
-        ))
-        self.totalSalience = (self.intraStringSalience + self.interStringSalience) / 2.0
+        # weighted_average() of two pairs whose weights sum to exactly 1.0,
+        # written out; the rounding is the same
+        relativeImportance = self.relativeImportance
+        intraStringSalience = (relativeImportance * 0.2
+                               + intraStringUnhappiness * 0.8)
+        interStringSalience = (relativeImportance * 0.8
+                               + interStringUnhappiness * 0.2)
+        self.intraStringSalience = intraStringSalience
+        self.interStringSalience = interStringSalience
+        self.totalSalience = (intraStringSalience + interStringSalience) / 2.0
 
     def isWithin(self, other):
         return (self.leftIndex >= other.leftIndex and
@@ -108,43 +166,54 @@ class WorkspaceObject(WorkspaceStructure):
                 if d.descriptionType.fully_active()]
 
     def getPossibleDescriptions(self, descriptionType):
-        from .group import Group  # gross, TODO FIXME
         slipnet = self.ctx.slipnet
+        first, last, middle = slipnet.first, slipnet.last, slipnet.middle
+        # only a group's length can match a number node; 0 matches none, and
+        # neither does a non-number node's missing index
+        objectCount = 0
+        if self._kind == KIND_GROUP:
+            objectCount = len(self.objectList)
+        numberIndex = slipnet._number_index
         descriptions = []
+        # each node is at most one of these landmarks
         for link in descriptionType.instance_links:
             node = link.destination
-            if node == slipnet.first and self.described(slipnet.letters[0]):
-                descriptions += [node]
-            if node == slipnet.last and self.described(slipnet.letters[-1]):
-                descriptions += [node]
-            for i, number in enumerate(slipnet.numbers, 1):
-                if node == number and isinstance(self, Group):
-                    if len(self.objectList) == i:
-                        descriptions += [node]
-            if node == slipnet.middle and self.middleObject():
-                descriptions += [node]
+            if node is first:
+                if self.described(slipnet.letters[0]):
+                    descriptions.append(node)
+            elif node is last:
+                if self.described(slipnet.letters[-1]):
+                    descriptions.append(node)
+            elif node is middle:
+                if self.middleObject():
+                    descriptions.append(node)
+            elif numberIndex.get(node) == objectCount:
+                descriptions.append(node)
         return descriptions
 
     def containsDescription(self, sought):
-        soughtType = sought.descriptionType
-        soughtDescriptor = sought.descriptor
-        for d in self.descriptions:
-            if soughtType == d.descriptionType:
-                if soughtDescriptor == d.descriptor:
-                    return True
-        return False
+        return (sought.descriptionType, sought.descriptor) in self._descriptionKeys
 
     def described(self, slipnode):
-        return any(d.descriptor == slipnode for d in self.descriptions)
+        return slipnode in self._typeByDescriptor
 
     def middleObject(self):
-        # only works if string is 3 chars long
-        # as we have access to the string, why not just " == len / 2" ?
-        objectOnMyRightIsRightmost = objectOnMyLeftIsLeftmost = False
-        for objekt in self.string.objects:
-            if objekt.leftmost and objekt.rightIndex == self.leftIndex - 1:
+        # true when some object runs from the left end of the string up to
+        # this one and another from this one to the right end
+        string = self.string
+        before = self.leftIndex - 1
+        after = self.rightIndex + 1
+        if before < 1 or after > string.length:
+            return False
+        # the end letters are always objects, so one-letter gaps need no scan
+        objectOnMyLeftIsLeftmost = before == 1
+        objectOnMyRightIsRightmost = after == string.length
+        for objekt in string.objects:
+            if objectOnMyLeftIsLeftmost and objectOnMyRightIsRightmost:
+                break
+            if objekt.leftmost and objekt.rightIndex == before:
                 objectOnMyLeftIsLeftmost = True
-            if objekt.rightmost and objekt.leftIndex == self.rightIndex + 1:
+            if objekt.rightmost and objekt.leftIndex == after:
                 objectOnMyRightIsRightmost = True
         return objectOnMyRightIsRightmost and objectOnMyLeftIsLeftmost
 
@@ -153,28 +222,25 @@ class WorkspaceObject(WorkspaceStructure):
         return slipnet.is_distinguishing_descriptor(descriptor)
 
     def relevantDistinguishingDescriptors(self):
-        slipnet = self.ctx.slipnet
+        # relevantDescriptions() and the distinguishing test, in one pass
+        isDistinguishing = self.ctx.slipnet.is_distinguishing_descriptor
         return [d.descriptor
-                for d in self.relevantDescriptions()
-                if slipnet.is_distinguishing_descriptor(d.descriptor)]
+                for d in self.descriptions
+                if d.descriptionType.fully_active()
+                and isDistinguishing(d.descriptor)]
 
     def getDescriptor(self, descriptionType):
         """The description attached to this object of the description type."""
-        for description in self.descriptions:
-            if description.descriptionType == descriptionType:
-                return description.descriptor
-        return None
+        return self._descriptorByType.get(descriptionType)
 
     def getDescriptionType(self, sought_description):
         """The description_type attached to this object of that description"""
-        for description in self.descriptions:
-            if description.descriptor == sought_description:
-                return description.descriptionType
-        return None
+        return self._typeByDescriptor.get(sought_description)
 
     def getCommonGroups(self, other):
-        return [o for o in self.string.objects
-                if self.isWithin(o) and other.isWithin(o)]
+        # a letter cannot take in two different objects, so only groups can
+        return [g for g in self.string.groups()
+                if self.isWithin(g) and other.isWithin(g)]
 
     def letterDistance(self, other):
         if other.leftIndex > self.rightIndex:
@@ -184,7 +250,7 @@ class WorkspaceObject(WorkspaceStructure):
         return 0
 
     def letterSpan(self):
-        return self.rightIndex - self.leftIndex + 1
+        return self._letterSpan
 
     def beside(self, other):
         if self.string != other.string:
@@ -9,10 +9,13 @@ Classes:
         associated properties and methods for manipulation and analysis.
 """
 
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from .group import Group
 from .letter import Letter
 
+# letter values are offsets into slipnet.letters, counted from "A"
+_ORD_A = ord("A")
+
 
 class WorkspaceString(object):
     """
@@ -50,6 +53,12 @@ class WorkspaceString(object):
         update_intra_string_unhappiness():
             Updates the intra-string unhappiness based on the objects in the string.
 
+        add_group(group: Group), remove_group(group: Group):
+            Maintain the objects list together with the index of built groups.
+
+        groups() -> Iterable[Group]:
+            The built groups, in the order they appear among the objects.
+
         equivalent_group(sought: Any) -> Optional[Group]:
             Checks if there is an equivalent group to the sought group within the objects.
     """
@@ -60,6 +69,8 @@ class WorkspaceString(object):
     objects: List[Any]
     letters: List[Any]
     length: int
+    # built groups by Group.groupKey; changed only through add_/remove_group
+    _groups: Dict[Tuple[Any, ...], Group]
     intra_string_unhappiness: float
 
     def __init__(self, ctx: "Copycat", s: str):  # type: ignore ## noqa: F821
@@ -70,19 +81,25 @@ class WorkspaceString(object):
         self.bonds = []
         self.objects = []
         self.letters = []
+        self._groups = {}
         self.length = len(s)
         self.intra_string_unhappiness = 0.0
 
+        # every letter gets the same two category descriptions; look the
+        # nodes up once rather than per letter
+        object_category, letter_node = slipnet.object_category, slipnet.letter
+        letter_category, letter_nodes = slipnet.letter_category, slipnet.letters
+        length = self.length
         for position, c in enumerate(self.string.upper(), 1):
-            value = ord(c) - ord("A")
-            letter = Letter(self, position, self.length)
+            value = ord(c) - _ORD_A
+            letter = Letter(self, position, length)
             ## letter.workspaceString = self        ## TODO: check if this is needed
             ## assert letter.workspaceString == letter.string
-            letter.addDescription(slipnet.object_category, slipnet.letter)
-            letter.addDescription(slipnet.letter_category, slipnet.letters[value])
-            letter.describe(position, self.length)
-            workspace.build_descriptions(letter)
-            self.letters += [letter]
+            letter.addDescription(object_category, letter_node)
+            letter.addDescription(letter_category, letter_nodes[value])
+            letter.describe(position, length)
+            workspace.build_new_descriptions(letter)
+            self.letters.append(letter)
 
     def __repr__(self) -> str:
         return f"<WorkspaceString: {self.string}>"
@@ -115,13 +132,15 @@ class WorkspaceString(object):
             self.objects (list): A list of objects, each having 'rawImportance' 
                                  and 'relativeImportance' attributes.
         """
-        total = sum(objekt.rawImportance for objekt in self.objects)
+        objects = self.objects
+        raw = [objekt.rawImportance for objekt in objects]
+        total = sum(raw)
         if not total:
-            for objekt in self.objects:
+            for objekt in objects:
                 objekt.relativeImportance = 0.0
         else:
-            for objekt in self.objects:
-                objekt.relativeImportance = objekt.rawImportance / total
+            for objekt, importance in zip(objects, raw):
+                objekt.relativeImportance = importance / total
 
     def update_intra_string_unhappiness(self) -> None:
         """
@@ -131,24 +150,41 @@ class WorkspaceString(object):
         objects contained within the current object. If there are no objects,
         it sets the intra-string unhappiness to 0.0.
         """
-        if len(self.objects) == 0:
+        if not self.objects:
             self.intra_string_unhappiness = 0.0
             return
         total = sum(objekt.intraStringUnhappiness for objekt in self.objects)
         self.intra_string_unhappiness = total / len(self.objects)
 
+    def add_group(self, group: Group) -> None:
+        """Adds a newly built group to the string's objects."""
+        self.objects.append(group)
+        self._groups[group.groupKey] = group
+
+    def remove_group(self, group: Group) -> None:
+        """Removes a broken group from the string's objects, if it is present."""
+        if self._groups.get(group.groupKey) is group:
+            del self._groups[group.groupKey]
+        try:
+            self.objects.remove(group)
+        except ValueError:
+            pass
+
+    def groups(self) -> Iterable[Group]:
+        """The built groups of this string, in the order they appear in `objects`."""
+        return self._groups.values()
+
     def equivalent_group(self, sought) -> Optional[Group]:
         """
         Finds and returns an equivalent group from the list of objects.
 
+        Groups are equivalent when `Group.sameGroup` holds, i.e. when their
+        `groupKey`s are equal, so this is a lookup in the group index.
+
         Args:
             sought: The group to be matched against the objects.
 
         Returns:
             Optional[Group]: The matching group if found, otherwise None.
         """
-        for objekt in self.objects:
-            if isinstance(objekt, Group):
-                if objekt.sameGroup(sought):
-                    return objekt
-        return None
+        return self._groups.get(sought.groupKey)
@@ -16,6 +16,17 @@ Modules:
 
 from . import formulas
 
+# Integer tags identifying each concrete structure class; the workspace
+# compares these instead of calling isinstance in its counting loops.
+KIND_STRUCTURE = 0
+KIND_BOND = 1
+KIND_CORRESPONDENCE = 2
+KIND_LETTER = 3
+KIND_GROUP = 4
+KIND_DESCRIPTION = 5
+KIND_RULE = 6
+KIND_REPLACEMENT = 7
+
 
 class WorkspaceStructure(object):
     """
@@ -52,8 +63,13 @@ class WorkspaceStructure(object):
             Abstract method to break the structure. Must be implemented by subclasses.
     """
 
+    __slots__ = (
+        "ctx", "string", "internal_strength", "external_strength", "total_strength",
+    )
+
     ctx: "Copycat"  # type: ignore # noqa: F821
-    string = None
+    _kind: int = KIND_STRUCTURE
+    string: "WorkspaceString"  # type: ignore # noqa: F821
     internal_strength: float
     external_strength: float
     total_strength: float
@@ -6,7 +6,7 @@ import sys
 
 from pprint  import pprint
 from copycat import Problem
-from copycat.statistics import iso_chi_squared
+from copycat.statistics import iso_chi_squared, probability_difference
 
 # TODO: update test cases to use entropy
 
@@ -43,6 +43,14 @@ class TestCopycat(unittest.TestCase):
         for problem in problems:
             problem.test(iso_chi_squared)
 
+class TestProbabilityDifference(unittest.TestCase):
+    def test_empty_distribution(self):
+        answers = {'ijl': {'count': 3}}
+        with self.assertRaises(ZeroDivisionError):
+            probability_difference(answers, {'ijl': {'count': 0}})
+        with self.assertRaises(ZeroDivisionError):
+            probability_difference({}, answers)
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('--generate', action='store_true')